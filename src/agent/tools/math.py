@@ -1,30 +1,43 @@
+import math
+from functools import lru_cache
+from types import MappingProxyType
+
 from langchain_core.tools import tool
 
+# Safe evaluation environment with math functions, built once at import. The
+# names are read-only so an expression like "(pi := 3)" can't leak into later
+# calls; the globals (and their empty __builtins__) are rebuilt for every call,
+# since an expression can reach and modify them by name.
+_SAFE_NAMES = MappingProxyType(
+    {
+        "sqrt": math.sqrt,
+        "sin": math.sin,
+        "cos": math.cos,
+        "tan": math.tan,
+        "log": math.log,
+        "log10": math.log10,
+        "exp": math.exp,
+        "pow": math.pow,
+        "pi": math.pi,
+        "e": math.e,
+        "abs": abs,
+        "round": round,
+    }
+)
+
+
+@lru_cache(maxsize=256)
+def _compile(expression: str):
+    """Compile an expression to bytecode, memoized so repeats skip the parser."""
+    return compile(expression, "<calc>", "eval")
+
 
 @tool
 def calculate(expression: str) -> str:
     """Evaluate a math expression. Supports +, -, *, /, **, sqrt, sin, cos, tan, log, exp, pi, e."""
-    import math
-
     try:
-        # Create a safe evaluation environment with math functions
-        safe_dict = {
-            "sqrt": math.sqrt,
-            "sin": math.sin,
-            "cos": math.cos,
-            "tan": math.tan,
-            "log": math.log,
-            "log10": math.log10,
-            "exp": math.exp,
-            "pow": math.pow,
-            "pi": math.pi,
-            "e": math.e,
-            "abs": abs,
-            "round": round,
-        }
-
         # Evaluate the expression safely
-        result = eval(expression, {"__builtins__": {}}, safe_dict)
+        result = eval(_compile(expression), {"__builtins__": {}}, _SAFE_NAMES)
         return str(result)
     except Exception as e:
         return f"Error calculating '{expression}': {str(e)}"
@@ -4,15 +4,18 @@ Reminder tools for Rex voice assistant.
 Provides functionality to create, list, update, and delete reminders with SQLite persistence.
 """
 
+import heapq
 import sqlite3
 import threading
+import weakref
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from dateutil import parser as dateutil_parser
 from langchain_core.tools import tool
 
 if TYPE_CHECKING:
@@ -42,6 +45,12 @@ class ReminderManager:
     the AppContext or create_reminder_manager() factory.
     """
 
+    # Statements shared by several methods. sqlite3 caches prepared statements
+    # by exact SQL text, so each query is spelled once to get one cache entry.
+    _SQL_INSERT = "INSERT INTO reminders (message, due_datetime, created_at, status) VALUES (?, ?, ?, ?)"
+    _SQL_GET_BY_ID = "SELECT * FROM reminders WHERE id = ?"
+    _SQL_LIST_BY_STATUS = "SELECT * FROM reminders WHERE status = ? ORDER BY due_datetime"
+
     def __init__(self, db_path: str | Path = "data/reminders.db", event_bus: "EventBus | None" = None):
         """
         Initialize the reminder manager.
@@ -53,39 +62,93 @@ class ReminderManager:
         self._db_lock = threading.Lock()
         self._db_path = Path(db_path)
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # One long-lived connection, serialized by _db_lock, instead of a
+        # connect/close round trip per query
+        self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        # WAL lets commits append to the log with synchronous=NORMAL instead of
+        # fsyncing the main file on every write; a commit is only at risk on power loss
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+
         self._event_bus = event_bus
+        self._schedule_listeners: list[weakref.WeakMethod] = []
+
+        # Min-heap of (due_datetime, id) for pending reminders. Entries are
+        # invalidated lazily: _pending_due holds the authoritative due time for
+        # each pending id, and stale heap entries are dropped on peek.
+        self._due_heap: list[tuple[datetime, int]] = []
+        self._pending_due: dict[int, datetime] = {}
+
         self._init_db()
+        self._load_pending_heap()
+
+    def register_schedule_listener(self, callback: Callable[[], None]) -> None:
+        """
+        Register a bound method to call directly whenever the schedule changes.
+
+        Listeners are held weakly, so registering does not keep the owner alive.
+        This is the fast path for the reminder scheduler; the EventBus event is
+        still emitted for any other observers.
+
+        Args:
+            callback: Bound method taking no arguments
+        """
+        self._schedule_listeners = [*self._schedule_listeners, weakref.WeakMethod(callback)]
+
+    def unregister_schedule_listener(self, callback: Callable[[], None]) -> None:
+        """Remove a listener previously added with register_schedule_listener()."""
+        self._schedule_listeners = [ref for ref in self._schedule_listeners if ref() not in (None, callback)]
 
     def _emit_schedule_changed(self) -> None:
-        """Emit a schedule changed event if event bus is configured."""
+        """Notify direct schedule listeners, then emit on the event bus if configured."""
+        for ref in self._schedule_listeners:
+            callback = ref()
+            if callback is not None:
+                callback()
+
         if self._event_bus is not None:
             from core.events import ReminderScheduleChanged
 
             self._event_bus.emit(ReminderScheduleChanged())
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection."""
-        conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
-        conn.row_factory = sqlite3.Row
-        return conn
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._db_lock:
+            self._conn.close()
 
     def _init_db(self):
         """Initialize the database schema."""
         with self._db_lock:
-            conn = self._get_connection()
-            try:
-                conn.execute("""
-                    CREATE TABLE IF NOT EXISTS reminders (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        message TEXT NOT NULL,
-                        due_datetime TEXT NOT NULL,
-                        created_at TEXT NOT NULL,
-                        status TEXT NOT NULL DEFAULT 'pending'
-                    )
-                """)
-                conn.commit()
-            finally:
-                conn.close()
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS reminders (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    message TEXT NOT NULL,
+                    due_datetime TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending'
+                )
+            """)
+            # Serves the status-filtered, due-ordered queries without a scan and sort
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_reminders_status_due ON reminders(status, due_datetime)"
+            )
+            self._conn.commit()
+
+    def _load_pending_heap(self):
+        """Populate the next-due heap from pending reminders in the database."""
+        for reminder in self.list_reminders(status=ReminderStatus.PENDING):
+            self._track_pending(reminder)
+
+    def _track_pending(self, reminder: Reminder) -> None:
+        """Sync the next-due heap with a reminder's current state."""
+        if reminder.status != ReminderStatus.PENDING:
+            self._pending_due.pop(reminder.id, None)
+            return
+        if self._pending_due.get(reminder.id) != reminder.due_datetime:
+            self._pending_due[reminder.id] = reminder.due_datetime
+            heapq.heappush(self._due_heap, (reminder.due_datetime, reminder.id))
 
     def _row_to_reminder(self, row: sqlite3.Row) -> Reminder:
         """Convert a database row to a Reminder object."""
@@ -109,41 +172,77 @@ class ReminderManager:
             The created Reminder object
         """
         with self._db_lock:
-            conn = self._get_connection()
-            try:
-                now = datetime.now()
-                cursor = conn.execute(
-                    """
-                    INSERT INTO reminders (message, due_datetime, created_at, status)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (message, due_datetime.isoformat(), now.isoformat(), ReminderStatus.PENDING.value),
+            now = datetime.now()
+            cursor = self._conn.execute(
+                self._SQL_INSERT,
+                (message, due_datetime.isoformat(), now.isoformat(), ReminderStatus.PENDING.value),
+            )
+            self._conn.commit()
+
+            reminder = Reminder(
+                id=cursor.lastrowid,
+                message=message,
+                due_datetime=due_datetime,
+                created_at=now,
+                status=ReminderStatus.PENDING,
+            )
+            self._track_pending(reminder)
+
+        self._emit_schedule_changed()
+        return reminder
+
+    def create_reminders(self, items: Iterable[tuple[str, datetime]]) -> list[Reminder]:
+        """
+        Create several reminders in one transaction.
+
+        Args:
+            items: (message, due_datetime) pairs
+
+        Returns:
+            The created Reminder objects, in input order
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        with self._db_lock:
+            now = datetime.now()
+            with self._conn:
+                self._conn.executemany(
+                    self._SQL_INSERT,
+                    [
+                        (message, due_datetime.isoformat(), now.isoformat(), ReminderStatus.PENDING.value)
+                        for message, due_datetime in items
+                    ],
                 )
-                conn.commit()
+                # Rows from one executemany on this connection get consecutive ids
+                last_id = self._conn.execute("SELECT last_insert_rowid()").fetchone()[0]
 
-                reminder = Reminder(
-                    id=cursor.lastrowid,
+            first_id = last_id - len(items) + 1
+            reminders = [
+                Reminder(
+                    id=first_id + offset,
                     message=message,
                     due_datetime=due_datetime,
                     created_at=now,
                     status=ReminderStatus.PENDING,
                 )
-            finally:
-                conn.close()
+                for offset, (message, due_datetime) in enumerate(items)
+            ]
+
+            # Only track once the transaction has committed
+            for reminder in reminders:
+                self._track_pending(reminder)
 
         self._emit_schedule_changed()
-        return reminder
+        return reminders
 
     def get_reminder(self, reminder_id: int) -> Reminder | None:
         """Get a reminder by ID."""
         with self._db_lock:
-            conn = self._get_connection()
-            try:
-                cursor = conn.execute("SELECT * FROM reminders WHERE id = ?", (reminder_id,))
-                row = cursor.fetchone()
-                return self._row_to_reminder(row) if row else None
-            finally:
-                conn.close()
+            cursor = self._conn.execute(self._SQL_GET_BY_ID, (reminder_id,))
+            row = cursor.fetchone()
+            return self._row_to_reminder(row) if row else None
 
     def list_reminders(self, status: ReminderStatus | None = None) -> list[Reminder]:
         """
@@ -156,18 +255,11 @@ class ReminderManager:
             List of Reminder objects
         """
         with self._db_lock:
-            conn = self._get_connection()
-            try:
-                if status:
-                    cursor = conn.execute(
-                        "SELECT * FROM reminders WHERE status = ? ORDER BY due_datetime",
-                        (status.value,),
-                    )
-                else:
-                    cursor = conn.execute("SELECT * FROM reminders ORDER BY due_datetime")
-                return [self._row_to_reminder(row) for row in cursor.fetchall()]
-            finally:
-                conn.close()
+            if status:
+                cursor = self._conn.execute(self._SQL_LIST_BY_STATUS, (status.value,))
+            else:
+                cursor = self._conn.execute("SELECT * FROM reminders ORDER BY due_datetime")
+            return [self._row_to_reminder(row) for row in cursor.fetchall()]
 
     def get_due_reminders(self) -> list[Reminder]:
         """
@@ -177,20 +269,16 @@ class ReminderManager:
             List of due Reminder objects
         """
         with self._db_lock:
-            conn = self._get_connection()
-            try:
-                now = datetime.now().isoformat()
-                cursor = conn.execute(
-                    """
-                    SELECT * FROM reminders
-                    WHERE status = ? AND due_datetime <= ?
-                    ORDER BY due_datetime
-                    """,
-                    (ReminderStatus.PENDING.value, now),
-                )
-                return [self._row_to_reminder(row) for row in cursor.fetchall()]
-            finally:
-                conn.close()
+            now = datetime.now().isoformat()
+            cursor = self._conn.execute(
+                """
+                SELECT * FROM reminders
+                WHERE status = ? AND due_datetime <= ?
+                ORDER BY due_datetime
+                """,
+                (ReminderStatus.PENDING.value, now),
+            )
+            return [self._row_to_reminder(row) for row in cursor.fetchall()]
 
     def get_next_pending_time(self) -> datetime | None:
         """
@@ -200,22 +288,13 @@ class ReminderManager:
             The earliest due_datetime among pending reminders, or None if no pending reminders.
         """
         with self._db_lock:
-            conn = self._get_connection()
-            try:
-                cursor = conn.execute(
-                    """
-                    SELECT MIN(due_datetime) as next_time
-                    FROM reminders
-                    WHERE status = ?
-                    """,
-                    (ReminderStatus.PENDING.value,),
-                )
-                row = cursor.fetchone()
-                if row and row["next_time"]:
-                    return datetime.fromisoformat(row["next_time"])
-                return None
-            finally:
-                conn.close()
+            heap = self._due_heap
+            while heap:
+                due, reminder_id = heap[0]
+                if self._pending_due.get(reminder_id) == due:
+                    return due
+                heapq.heappop(heap)
+            return None
 
     def update_reminder(
         self,
@@ -236,37 +315,36 @@ class ReminderManager:
         Returns:
             Updated Reminder object, or None if not found
         """
+        # Checked before taking _db_lock, which get_reminder acquires itself
+        if message is None and due_datetime is None and status is None:
+            return self.get_reminder(reminder_id)
+
         with self._db_lock:
-            conn = self._get_connection()
-            try:
-                # Build update query dynamically
-                updates = []
-                params = []
-
-                if message is not None:
-                    updates.append("message = ?")
-                    params.append(message)
-                if due_datetime is not None:
-                    updates.append("due_datetime = ?")
-                    params.append(due_datetime.isoformat())
-                if status is not None:
-                    updates.append("status = ?")
-                    params.append(status.value)
-
-                if not updates:
-                    return self.get_reminder(reminder_id)
-
-                params.append(reminder_id)
-                query = f"UPDATE reminders SET {', '.join(updates)} WHERE id = ?"
-                conn.execute(query, params)
-                conn.commit()
-
-                # Fetch and return updated reminder
-                cursor = conn.execute("SELECT * FROM reminders WHERE id = ?", (reminder_id,))
-                row = cursor.fetchone()
-                result = self._row_to_reminder(row) if row else None
-            finally:
-                conn.close()
+            # One fixed statement for every field combination so the connection's
+            # prepared-statement cache always hits; NULL leaves a column unchanged
+            self._conn.execute(
+                """
+                UPDATE reminders SET
+                    message = COALESCE(?, message),
+                    due_datetime = COALESCE(?, due_datetime),
+                    status = COALESCE(?, status)
+                WHERE id = ?
+                """,
+                (
+                    message,
+                    due_datetime.isoformat() if due_datetime is not None else None,
+                    status.value if status is not None else None,
+                    reminder_id,
+                ),
+            )
+            self._conn.commit()
+
+            # Fetch and return updated reminder
+            cursor = self._conn.execute(self._SQL_GET_BY_ID, (reminder_id,))
+            row = cursor.fetchone()
+            result = self._row_to_reminder(row) if row else None
+            if result is not None:
+                self._track_pending(result)
 
         # Emit schedule changed if due_datetime was updated
         if due_datetime is not None:
@@ -285,13 +363,10 @@ class ReminderManager:
             True if deleted, False if not found
         """
         with self._db_lock:
-            conn = self._get_connection()
-            try:
-                cursor = conn.execute("DELETE FROM reminders WHERE id = ?", (reminder_id,))
-                conn.commit()
-                deleted = cursor.rowcount > 0
-            finally:
-                conn.close()
+            cursor = self._conn.execute("DELETE FROM reminders WHERE id = ?", (reminder_id,))
+            self._conn.commit()
+            deleted = cursor.rowcount > 0
+            self._pending_due.pop(reminder_id, None)
 
         if deleted:
             self._emit_schedule_changed()
@@ -324,6 +399,24 @@ class ReminderManager:
         return self.update_reminder(reminder_id, due_datetime=new_due_datetime, status=ReminderStatus.PENDING)
 
 
+@lru_cache(maxsize=512)
+def _parse_fuzzy(text: str, today: date) -> datetime | None:
+    """
+    Run dateutil's fuzzy parser, memoized per input and day.
+
+    dateutil fills fields missing from the text with its default, which is
+    midnight today; passing that explicitly makes the result depend only on
+    the arguments, so identical phrasings on the same day hit the cache.
+    """
+    # Imported on first use; only reminder creation and updates parse dates
+    from dateutil import parser as dateutil_parser
+
+    try:
+        return dateutil_parser.parse(text, fuzzy=True, default=datetime.combine(today, time()))
+    except (ValueError, TypeError):
+        return None
+
+
 def parse_datetime(datetime_str: str) -> datetime | None:
     """
     Parse a datetime string into a datetime object.
@@ -343,6 +436,17 @@ def parse_datetime(datetime_str: str) -> datetime | None:
     if not datetime_str or not datetime_str.strip():
         return None
 
+    # ISO 8601 is unambiguous and parses in C; skip the natural-language path for it
+    try:
+        parsed = datetime.fromisoformat(datetime_str.strip())
+    except ValueError:
+        pass
+    else:
+        if parsed.tzinfo is not None:
+            # Reminders are stored as naive local times
+            parsed = parsed.astimezone().replace(tzinfo=None)
+        return parsed
+
     original = datetime_str.strip().lower()
     modified = original
 
@@ -377,42 +481,41 @@ def parse_datetime(datetime_str: str) -> datetime | None:
     if modified != before:
         has_explicit_time = True
 
-    try:
-        # Use dateutil parser with fuzzy matching for natural language
-        parsed = dateutil_parser.parse(modified, fuzzy=True)
+    # Use dateutil parser with fuzzy matching for natural language
+    parsed = _parse_fuzzy(modified, now.date())
+    if parsed is None:
+        return None
 
-        # Check if AM/PM (or noon/midnight) was explicitly specified
-        has_explicit_ampm = has_explicit_time or any(
-            marker in original for marker in ["am", "pm", "a.m", "p.m"]
-        )
+    # Check if AM/PM (or noon/midnight) was explicitly specified
+    has_explicit_ampm = has_explicit_time or any(
+        marker in original for marker in ["am", "pm", "a.m", "p.m"]
+    )
 
-        if not has_explicit_ampm:
-            # For ambiguous times, find the soonest future AM or PM interpretation
-            hour = parsed.hour
-            am_hour = hour % 12
-            pm_hour = am_hour + 12
+    if not has_explicit_ampm:
+        # For ambiguous times, find the soonest future AM or PM interpretation
+        hour = parsed.hour
+        am_hour = hour % 12
+        pm_hour = am_hour + 12
 
-            am_version = parsed.replace(hour=am_hour)
-            pm_version = parsed.replace(hour=pm_hour)
+        am_version = parsed.replace(hour=am_hour)
+        pm_version = parsed.replace(hour=pm_hour)
 
-            candidates = [am_version, pm_version]
+        candidates = [am_version, pm_version]
 
-            # Only consider next day if parsed date is today (likely no explicit date given)
-            if parsed.date() == now.date():
-                candidates.extend([am_version + timedelta(days=1), pm_version + timedelta(days=1)])
+        # Only consider next day if parsed date is today (likely no explicit date given)
+        if parsed.date() == now.date():
+            candidates.extend([am_version + timedelta(days=1), pm_version + timedelta(days=1)])
 
-            # Filter to future times and pick the soonest
-            future_candidates = [c for c in candidates if c > now]
-            if future_candidates:
-                parsed = min(future_candidates)
+        # Filter to future times and pick the soonest
+        future_candidates = [c for c in candidates if c > now]
+        if future_candidates:
+            parsed = min(future_candidates)
 
-        return parsed
-    except (ValueError, TypeError):
-        return None
+    return parsed
 
 
 # Set of tool names that require confirmation
-CONFIRMABLE_TOOLS = {"create_reminder"}
+CONFIRMABLE_TOOLS = frozenset({"create_reminder"})
 
 
 def tool_requires_confirmation(tool_name: str) -> bool:
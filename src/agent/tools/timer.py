@@ -24,6 +24,24 @@ if TYPE_CHECKING:
     from core.events import EventBus
 
 
+# Seconds per unit word, for the single "<number> <unit>" fast path in parse_duration
+_UNIT_SECONDS = {
+    **dict.fromkeys(("h", "hr", "hrs", "hour", "hours"), 3600.0),
+    **dict.fromkeys(("m", "min", "mins", "minute", "minutes"), 60.0),
+    **dict.fromkeys(("s", "sec", "secs", "second", "seconds"), 1.0),
+}
+
+_HOURS_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*(?:hours?|hrs?|h)")
+_MINUTES_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*(?:minutes?|mins?|m)(?!s)")
+_SECONDS_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*(?:seconds?|secs?|s)")
+
+
+def _is_plain_number(token: str) -> bool:
+    """True for unsigned decimals like "5" or "1.5", matching what the patterns accept."""
+    whole, point, fraction = token.partition(".")
+    return whole.isdecimal() and (not point or fraction.isdecimal())
+
+
 class TimerState(Enum):
     PENDING = "pending"
     RINGING = "ringing"
@@ -67,26 +85,37 @@ class TimerManager:
         self._current_ringing: str | None = None
         self._muted = False
 
-        # Load and prepare sound file
-        sound_path = Path(sound_path)
-        if sound_path.exists():
-            raw_audio, self._sample_rate = sf.read(sound_path)
-            # Convert to mono if stereo
-            if len(raw_audio.shape) > 1:
-                raw_audio = raw_audio.mean(axis=1)
-            self._sound_data = raw_audio.astype(np.float32)
-        else:
-            self._sound_data = None
-            self._sample_rate = None
+        # The alarm sound is decoded on the first ring, so managers that never
+        # ring (or have no audio output) don't pay for decoding it at startup
+        self._sound_path = Path(sound_path)
+        self._sound_loaded = False
+        self._sound_data: np.ndarray | None = None
+        self._sample_rate: int | None = None
 
     def _emit_event(self, event) -> None:
         """Emit an event if event bus is configured."""
         if self._event_bus is not None:
             self._event_bus.emit(event)
 
+    def _load_sound(self):
+        """Decode the alarm sound file to mono float32, once."""
+        if self._sound_loaded:
+            return
+        if self._sound_path.exists():
+            raw_audio, sample_rate = sf.read(self._sound_path)
+            # Convert to mono if stereo
+            if len(raw_audio.shape) > 1:
+                raw_audio = raw_audio.mean(axis=1)
+            self._sound_data = raw_audio.astype(np.float32)
+            self._sample_rate = sample_rate
+        self._sound_loaded = True
+
     def _start_alarm_sound(self):
         """Start the alarm sound loop through AudioManager."""
-        if self._sound_data is None or self._audio_manager is None:
+        if self._audio_manager is None:
+            return
+        self._load_sound()
+        if self._sound_data is None:
             return
         if not self._muted:
             self._audio_manager.start_loop(self._sound_data, self._sample_rate)
@@ -296,23 +325,33 @@ def parse_duration(duration_str: str) -> float | None:
     """
     duration_str = duration_str.lower().strip()
 
+    # Most requests are a bare number or one "<number> <unit>" pair; handle those
+    # without running the three unit patterns
+    tokens = duration_str.split()
+    if len(tokens) == 1 and _is_plain_number(tokens[0]):
+        total_seconds = float(tokens[0]) * 60
+        return total_seconds if total_seconds > 0 else None
+    if len(tokens) == 2 and tokens[1] in _UNIT_SECONDS and _is_plain_number(tokens[0]):
+        total_seconds = float(tokens[0]) * _UNIT_SECONDS[tokens[1]]
+        return total_seconds if total_seconds > 0 else None
+
     total_seconds = 0.0
     found_any = False
 
     # Pattern for hours
-    hours_match = re.search(r"(\d+(?:\.\d+)?)\s*(?:hours?|hrs?|h)", duration_str)
+    hours_match = _HOURS_PATTERN.search(duration_str)
     if hours_match:
         total_seconds += float(hours_match.group(1)) * 3600
         found_any = True
 
     # Pattern for minutes
-    minutes_match = re.search(r"(\d+(?:\.\d+)?)\s*(?:minutes?|mins?|m)(?!s)", duration_str)
+    minutes_match = _MINUTES_PATTERN.search(duration_str)
     if minutes_match:
         total_seconds += float(minutes_match.group(1)) * 60
         found_any = True
 
     # Pattern for seconds
-    seconds_match = re.search(r"(\d+(?:\.\d+)?)\s*(?:seconds?|secs?|s)", duration_str)
+    seconds_match = _SECONDS_PATTERN.search(duration_str)
     if seconds_match:
         total_seconds += float(seconds_match.group(1))
         found_any = True
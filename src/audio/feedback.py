@@ -11,6 +11,7 @@ All tones are played through AudioManager for coordinated audio output.
 
 from __future__ import annotations
 
+from functools import cache
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -51,18 +52,22 @@ def _generate_tone(
         volume: Volume multiplier (0.0 to 1.0)
         envelope_duration: Duration of fade-in/fade-out in seconds (default 20ms)
     """
-    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-    tone = np.sin(2 * np.pi * frequency * t)
-
-    # Apply raised cosine envelope to avoid clicks
+    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False, dtype=np.float32)
+    # Built in place in float32: the phase, the sine and the volume each reuse one buffer
+    tone = np.multiply(t, np.float32(2 * np.pi * frequency), out=t)
+    np.sin(tone, out=tone)
+    tone *= np.float32(volume)
+
+    # Apply raised cosine envelope to avoid clicks. Only the ends are shaped;
+    # the middle of the envelope is 1, so it is left untouched
     envelope_samples = int(envelope_duration * sample_rate)
-    envelope = np.ones_like(tone)
+    ramp = np.cos(np.linspace(0, np.pi, envelope_samples, dtype=np.float32))
     # Fade in: 0.5 * (1 - cos(pi * t)) goes from 0 to 1 smoothly
-    envelope[:envelope_samples] = 0.5 * (1 - np.cos(np.pi * np.linspace(0, 1, envelope_samples)))
+    tone[:envelope_samples] *= 0.5 * (1 - ramp)
     # Fade out: 0.5 * (1 + cos(pi * t)) goes from 1 to 0 smoothly
-    envelope[-envelope_samples:] = 0.5 * (1 + np.cos(np.pi * np.linspace(0, 1, envelope_samples)))
+    tone[len(tone) - envelope_samples :] *= 0.5 * (1 + ramp)
 
-    return (tone * envelope * volume).astype(np.float32)
+    return tone
 
 
 def _generate_two_tone_sequence(freq1: float, freq2: float) -> np.ndarray:
@@ -74,16 +79,27 @@ def _generate_two_tone_sequence(freq1: float, freq2: float) -> np.ndarray:
     return np.concatenate([tone1, gap, tone2])
 
 
+def _read_only(audio: np.ndarray) -> np.ndarray:
+    """Mark a cached buffer read-only so no caller can alter the shared copy."""
+    audio.setflags(write=False)
+    return audio
+
+
+# The tones are fixed, so each is synthesized once and the same read-only
+# buffer is handed out on every call
+@cache
 def generate_listening_tone() -> np.ndarray:
     """Generate ascending C→G tone to indicate Rex is listening."""
-    return _generate_two_tone_sequence(C4, G4)
+    return _read_only(_generate_two_tone_sequence(C4, G4))
 
 
+@cache
 def generate_done_tone() -> np.ndarray:
     """Generate descending G→C tone to indicate Rex has finished listening."""
-    return _generate_two_tone_sequence(G4, C4)
+    return _read_only(_generate_two_tone_sequence(G4, C4))
 
 
+@cache
 def generate_thinking_sequence() -> np.ndarray:
     """Generate a D→A tone sequence with slower timing for thinking feedback."""
     # Use longer 50ms envelope for smoother fade-in (reduces pop at loop start)
@@ -91,7 +107,7 @@ def generate_thinking_sequence() -> np.ndarray:
     gap = np.zeros(int(SAMPLE_RATE * THINKING_GAP_DURATION), dtype=np.float32)
     tone2 = _generate_tone(A4, THINKING_NOTE_DURATION, volume=THINKING_VOLUME, envelope_duration=0.05)
     trailing_gap = np.zeros(int(SAMPLE_RATE * THINKING_GAP_DURATION), dtype=np.float32)
-    return np.concatenate([tone1, gap, tone2, trailing_gap])
+    return _read_only(np.concatenate([tone1, gap, tone2, trailing_gap]))
 
 
 class ThinkingTone:
@@ -8,7 +8,7 @@ Coordinates all audio I/O operations:
 - Muting support during conversations
 """
 
-import queue
+import collections
 import threading
 from contextlib import contextmanager
 from dataclasses import dataclass
@@ -72,9 +72,11 @@ class AudioManager:
         self._input_stream: sd.InputStream | None = None
 
         # Persistent output stream (single stream for all audio output)
-        # Using a sentinel value to signal completion for blocking playback
+        # Using a sentinel value to signal completion for blocking playback.
+        # deque append/popleft are atomic, so the realtime output callback can
+        # consume without the mutex + condition variable of queue.Queue.
         self._COMPLETION_SENTINEL = object()
-        self._output_queue: queue.Queue[np.ndarray | object] = queue.Queue()
+        self._output_queue: collections.deque[np.ndarray | object] = collections.deque()
         self._current_output: np.ndarray | None = None
         self._output_position = 0
         self._loop_audio: np.ndarray | None = None
@@ -137,13 +139,13 @@ class AudioManager:
                 self._current_output = None
                 self._output_position = 0
                 # Clear the queue
-                while not self._output_queue.empty():
+                while True:
                     try:
-                        item = self._output_queue.get_nowait()
-                        if item is self._COMPLETION_SENTINEL:
-                            self._completion_event.set()
-                    except queue.Empty:
+                        item = self._output_queue.popleft()
+                    except IndexError:
                         break
+                    if item is self._COMPLETION_SENTINEL:
+                        self._completion_event.set()
                 self._stop_requested = False
             outdata[:, 0] = 0.0
             return
@@ -169,7 +171,7 @@ class AudioManager:
 
             # Try to get next audio from queue (non-blocking)
             try:
-                item = self._output_queue.get_nowait()
+                item = self._output_queue.popleft()
                 # Check for completion sentinel
                 if item is self._COMPLETION_SENTINEL:
                     self._completion_event.set()
@@ -177,13 +179,13 @@ class AudioManager:
                 self._current_output = item
                 self._output_position = 0
                 continue
-            except queue.Empty:
+            except IndexError:
                 pass
 
-            # Check for loop audio
+            # Check for loop audio (read-only, so play it in place without copying)
             with self._output_lock:
                 if self._loop_audio is not None:
-                    self._current_output = self._loop_audio.copy()
+                    self._current_output = self._loop_audio
                     self._output_position = 0
                     continue
 
@@ -217,7 +219,7 @@ class AudioManager:
             # Assume int16 range, normalize
             audio = audio / 32768.0
 
-        self._output_queue.put(audio)
+        self._output_queue.append(audio)
 
     def queue_audio_blocking(
         self, audio: np.ndarray, sample_rate: int | None = None, interrupt_check=None
@@ -230,18 +232,31 @@ class AudioManager:
             sample_rate: Sample rate of the audio (defaults to OUTPUT_SAMPLE_RATE)
             interrupt_check: Optional callable that returns True if playback should stop
 
+        Returns:
+            True if playback was interrupted, False if completed normally
+        """
+        self.queue_audio(audio, sample_rate)
+        return self.wait_until_played(interrupt_check)
+
+    def wait_until_played(self, interrupt_check=None) -> bool:
+        """
+        Wait for everything queued so far to finish playing.
+
+        Lets callers queue several chunks back to back (e.g. while still
+        synthesizing later ones) and block only once at the end.
+
+        Args:
+            interrupt_check: Optional callable that returns True if playback should stop
+
         Returns:
             True if playback was interrupted, False if completed normally
         """
         if self._muted:
             return False
 
-        # Queue the audio
-        self.queue_audio(audio, sample_rate)
-
         # Queue a completion sentinel
         self._completion_event.clear()
-        self._output_queue.put(self._COMPLETION_SENTINEL)
+        self._output_queue.append(self._COMPLETION_SENTINEL)
 
         # Wait for completion, checking for interrupts
         while not self._completion_event.is_set():
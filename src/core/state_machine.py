@@ -73,11 +73,13 @@ class ConversationState(Enum):
     SHUTTING_DOWN = auto()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StateResult:
     """
     Result of processing a state.
 
+    Immutable so that data-less results can be shared; see WAITING_RESULT.
+
     Attributes:
         next_state: The state to transition to
         data: Optional data to pass to the next state
@@ -87,6 +89,11 @@ class StateResult:
     data: dict | None = None
 
 
+# Shared results for the common transitions that carry no data
+WAITING_RESULT = StateResult(next_state=ConversationState.WAITING_FOR_WAKE_WORD)
+SHUTDOWN_RESULT = StateResult(next_state=ConversationState.SHUTTING_DOWN)
+
+
 class StateHandler(ABC):
     """
     Abstract base class for state handlers.
@@ -4,22 +4,28 @@ Main CLI entry point for Rex voice assistant.
 Uses the state machine architecture for conversation flow management.
 """
 
+import logging
 import sys
 import threading
 from pathlib import Path
 
 from agent import initialize_agent
 from core import StateMachine, create_app_context
+from rex.logsetup import setup_logging, shutdown_logging
 from rex.reminder_scheduler import ReminderDelivery, ReminderScheduler
 from rex.states import create_all_handlers
 from stt import Transcriber
 from tts import InterruptibleSpeaker, load_voice
 from wake_word import WakeWordListener
 
+# Named explicitly so output still reaches the rex handler when run as __main__
+log = logging.getLogger("rex.cli")
+
 
 def main():
     """Main voice assistant entry point using state machine architecture."""
-    print("🚀 Starting Rex Voice Assistant...")
+    setup_logging()
+    log.info("🚀 Starting Rex Voice Assistant...")
 
     ctx = create_app_context()
 
@@ -30,23 +36,39 @@ def main():
         f"models/wake_word_models/{ctx.settings.wake_word.path_label}/{ctx.settings.wake_word.path_label}.onnx",
     )
     if not model_path.exists():
-        print(f"❌ Error: Wake word model not found at {model_path}")
+        log.error("❌ Error: Wake word model not found at %s", model_path)
+        shutdown_logging()
         return 1
 
-    print("Loading models...")
+    log.info("Loading models...")
     listener = WakeWordListener(
         model_path=str(model_path),
         audio_manager=ctx.audio_manager,
         threshold=0.5,
     )
     voice = load_voice()
-    transcriber = Transcriber()
+    transcriber = Transcriber(
+        model=ctx.settings.stt.model,
+        device=ctx.settings.stt.device,
+        compute_type=ctx.settings.stt.compute_type,
+        beam_size=ctx.settings.stt.beam_size,
+        silence_threshold=ctx.settings.stt.silence_threshold,
+    )
     speaker = InterruptibleSpeaker(
         voice=voice,
         audio_manager=ctx.audio_manager,
         model_path=str(model_path),
     )
 
+    # Whisper loads in the background alongside the models above; fail at
+    # startup rather than on every utterance if it couldn't be loaded
+    try:
+        transcriber.wait_until_ready()
+    except RuntimeError as e:
+        log.error("❌ Error: %s: %s", e, e.__cause__)
+        shutdown_logging()
+        return 1
+
     # Initialize reminder scheduler with interrupt callback
     reminder_interrupt = threading.Event()
 
@@ -59,7 +81,6 @@ def main():
         reminder_manager=ctx.reminder_manager,
         reminder_settings=ctx.settings.reminders,
         on_reminder_due=on_reminder_due,
-        event_bus=ctx.event_bus,
         audio_manager=ctx.audio_manager,
     )
     scheduler.start()
@@ -74,20 +95,25 @@ def main():
 
     state_machine = StateMachine(ctx, handlers)
 
-    print("\n✅ Rex is ready!")
-    print("   Press Ctrl+C to exit\n")
+    log.info("\n✅ Rex is ready!")
+    log.info("   Press Ctrl+C to exit\n")
 
     try:
+        speaker.open()
         state_machine.run()
     except KeyboardInterrupt:
-        print("\n\n🛑 Shutting down Rex...")
+        log.info("\n\n🛑 Shutting down Rex...")
     finally:
-        scheduler.stop()
+        scheduler.close()
         listener.stop()
+        speaker.close()
         if ctx.timer_manager:
             ctx.timer_manager.cleanup()
+        if ctx.reminder_manager:
+            ctx.reminder_manager.close()
         if ctx.audio_manager:
             ctx.audio_manager.cleanup()
+        shutdown_logging()
 
     return 0
 
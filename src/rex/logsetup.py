@@ -0,0 +1,52 @@
+"""
+Non-blocking console logging for the voice loop.
+
+State handlers log through the ``rex`` logger hierarchy. Records are handed to a
+queue and written to stdout by a background listener thread, so terminal I/O
+never stalls capture, transcription, or playback.
+"""
+
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+_listener: QueueListener | None = None
+
+
+def setup_logging(level: int = logging.INFO) -> None:
+    """
+    Route ``rex`` log records through a queue to a background stdout writer.
+
+    Safe to call more than once; later calls are no-ops.
+
+    Args:
+        level: Minimum level to emit
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    # Only our own loggers; third-party INFO chatter (HTTP clients etc.) stays off the console
+    logger = logging.getLogger("rex")
+    logger.setLevel(level)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.propagate = False
+
+    _listener = QueueListener(log_queue, stream_handler)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the background writer."""
+    global _listener
+    if _listener is None:
+        return
+
+    _listener.stop()
+    _listener = None
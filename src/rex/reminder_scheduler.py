@@ -1,16 +1,19 @@
 """
 Reminder scheduler for Rex voice assistant.
 
-Runs a background thread that wakes at the exact time reminders are due,
-rather than polling. Uses event-based notification to recalculate wake
-times when reminders are created, updated, or deleted.
+Arms a single threading.Timer for the moment the next reminder is due,
+rather than polling or keeping a dedicated loop thread alive. Registers a
+direct schedule listener on the ReminderManager to re-arm the timer when
+reminders are created, updated, or deleted.
 
 Routes audio through AudioManager to avoid race conditions.
 """
 
 from __future__ import annotations
 
+import logging
 import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -19,9 +22,12 @@ from typing import TYPE_CHECKING, Callable
 if TYPE_CHECKING:
     from agent.tools.reminder import Reminder, ReminderManager
     from audio.manager import AudioManager
-    from core.events import EventBus
     from rex.settings import ReminderSettings
 
+log = logging.getLogger(__name__)
+
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
 
 @dataclass
 class ReminderDelivery:
@@ -32,11 +38,12 @@ class ReminderDelivery:
 
 class ReminderScheduler:
     """
-    Background scheduler that wakes precisely when reminders are due.
+    Event-driven scheduler that wakes precisely when reminders are due.
 
     Instead of polling at fixed intervals, the scheduler calculates how
-    long to sleep until the next reminder is due. It subscribes to
-    ReminderScheduleChanged events to recalculate when the schedule changes.
+    long to wait until the next reminder is due and arms a one-shot timer.
+    It registers a schedule listener on the ReminderManager to re-arm the
+    timer when the schedule changes.
     """
 
     def __init__(
@@ -44,7 +51,6 @@ class ReminderScheduler:
         reminder_manager: "ReminderManager",
         reminder_settings: "ReminderSettings",
         on_reminder_due: Callable[[ReminderDelivery], None] | None = None,
-        event_bus: "EventBus | None" = None,
         audio_manager: "AudioManager | None" = None,
     ):
         """
@@ -54,19 +60,16 @@ class ReminderScheduler:
             reminder_manager: ReminderManager instance for accessing reminders
             reminder_settings: ReminderSettings instance for configuration
             on_reminder_due: Callback when a reminder is due
-            event_bus: EventBus for schedule change notifications
             audio_manager: AudioManager instance for audio output
         """
         self._reminder_manager = reminder_manager
         self._reminder_settings = reminder_settings
-        self._event_bus = event_bus
         self._on_reminder_due = on_reminder_due
         self._audio_manager = audio_manager
 
         self._running = False
-        self._thread: threading.Thread | None = None
-        self._stop_event = threading.Event()
-        self._wake_event = threading.Event()
+        self._timer: threading.Timer | None = None
+        self._timer_lock = threading.Lock()
         self._pending_delivery: ReminderDelivery | None = None
         self._delivery_lock = threading.Lock()
         self._delivery_event = threading.Event()
@@ -74,88 +77,93 @@ class ReminderScheduler:
         # Sound file path (loaded on demand by AudioManager)
         self._ding_path = Path("sounds/ding.mp3")
 
+        # Register once; the listener is a no-op while the scheduler is stopped
+        self._reminder_manager.register_schedule_listener(self._on_schedule_changed)
+
     def _get_retry_minutes(self) -> int:
         """Get retry minutes from settings."""
         return self._reminder_settings.retry_minutes
 
     def start(self):
-        """Start the background scheduler thread."""
+        """Start scheduling, delivering any reminders that are already due."""
         if self._running:
             return
 
         self._running = True
-        self._stop_event.clear()
-        self._wake_event.clear()
-
-        # Subscribe to schedule change events
-        if self._event_bus:
-            from core.events import ReminderScheduleChanged
-
-            self._event_bus.subscribe(ReminderScheduleChanged, self._on_schedule_changed)
-
-        self._thread = threading.Thread(target=self._scheduler_loop, daemon=True)
-        self._thread.start()
+        self._on_timer()
 
     def stop(self):
-        """Stop the background scheduler thread."""
+        """Stop scheduling and cancel the pending timer."""
         self._running = False
-        self._stop_event.set()
-        self._wake_event.set()  # Wake up any waiting
         self._delivery_event.set()
 
-        # Unsubscribe from events
-        if self._event_bus:
-            from core.events import ReminderScheduleChanged
-
-            self._event_bus.unsubscribe(ReminderScheduleChanged, self._on_schedule_changed)
+        with self._timer_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
 
-        if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=2.0)
-        self._thread = None
+    def close(self):
+        """Stop the scheduler and detach it from the ReminderManager."""
+        self.stop()
+        self._reminder_manager.unregister_schedule_listener(self._on_schedule_changed)
 
-    def _on_schedule_changed(self, event) -> None:
-        """Handler for ReminderScheduleChanged events - wakes the scheduler."""
-        self._wake_event.set()
+    def _on_schedule_changed(self) -> None:
+        """Schedule listener called by the ReminderManager - re-arms the timer."""
+        if not self._running:
+            return
+        self._arm_next()
 
-    def _calculate_next_wake_time(self) -> datetime | None:
+    def _next_wake_ns(self) -> int | None:
         """
-        Calculate when to next wake up.
+        Calculate when to next wake up, on the time.monotonic_ns() clock.
+
+        Wall-clock time is only consulted here, once per schedule change; the
+        minute rounding is done with integer nanoseconds.
 
         Returns:
-            The time to wake up (rounded down to :00 seconds), or None if no pending reminders.
+            The monotonic deadline for the start of the due minute (or the exact
+            due time once that minute has started), or None if no pending reminders.
         """
         next_time = self._reminder_manager.get_next_pending_time()
 
         if next_time is None:
             return None
 
-        # Round down to the start of the minute
-        return next_time.replace(second=0, microsecond=0)
+        now_ns = time.monotonic_ns()
+        due_ns = now_ns + (next_time - datetime.now()) // _ONE_MICROSECOND * 1_000
 
-    def _scheduler_loop(self):
-        """Main scheduler loop that wakes at precise reminder times."""
-        # Check immediately on startup for any already-due reminders
+        # Round down to the start of the minute
+        wake_ns = due_ns - (next_time.second * 1_000_000_000 + next_time.microsecond * 1_000)
+        if wake_ns <= now_ns:
+            return due_ns
+        return wake_ns
+
+    def _arm_next(self):
+        """Cancel any pending timer and arm a new one for the next wake time."""
+        with self._timer_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+            # A pending delivery re-arms the timer when it is cleared
+            if not self._running or self.has_pending_delivery():
+                return
+
+            wake_ns = self._next_wake_ns()
+            if wake_ns is None:
+                return
+
+            delay = max(0, wake_ns - time.monotonic_ns()) / 1e9
+            self._timer = threading.Timer(delay, self._on_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _on_timer(self):
+        """Check for due reminders, then arm the timer for the next one."""
+        if not self._running:
+            return
         self._check_due_reminders()
-
-        while self._running and not self._stop_event.is_set():
-            next_wake = self._calculate_next_wake_time()
-
-            if next_wake is not None:
-                # Sleep until the start of the due minute
-                sleep_seconds = (next_wake - datetime.now()).total_seconds()
-                if sleep_seconds <= 0:
-                    # Already due - check immediately
-                    self._check_due_reminders()
-                    continue
-
-            # Wait until timeout or nudged by schedule change
-            self._wake_event.clear()
-
-            if self._stop_event.is_set():
-                break
-
-            # Check for due reminders (whether woken by timeout or event)
-            self._check_due_reminders()
+        self._arm_next()
 
     def _check_due_reminders(self):
         """Check for due reminders and trigger delivery."""
@@ -206,6 +214,9 @@ class ReminderScheduler:
             self._pending_delivery = None
             self._delivery_event.clear()
 
+        # Other reminders may have come due while this one was being delivered
+        self._on_schedule_changed()
+
     def mark_delivered(self, reminder_id: int):
         """Mark a reminder as successfully delivered (user acknowledged)."""
         self._reminder_manager.clear_reminder(reminder_id)
@@ -243,7 +254,7 @@ class ReminderScheduler:
             try:
                 self._audio_manager.play_sound_file(self._ding_path, blocking=True)
             except Exception as e:
-                print(f"Warning: Could not play ding sound: {e}")
+                log.warning("Could not play ding sound: %s", e)
 
     def has_pending_delivery(self) -> bool:
         """Check if there's a pending delivery."""
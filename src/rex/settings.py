@@ -5,7 +5,7 @@ Loads configuration from settings.toml at the repository root.
 """
 
 import tomllib
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
@@ -32,6 +32,17 @@ class LLMSettings:
     model: str = "gpt-3.5-turbo"
 
 
+@dataclass
+class STTSettings:
+    """Settings related to speech-to-text."""
+
+    model: str = "base.en"  # Whisper model size; "small" or larger for harder audio
+    device: str = "auto"  # "auto" picks CUDA when available, else CPU
+    compute_type: str = "auto"  # "auto" picks float16 on CUDA, int8 on CPU
+    beam_size: int = 1  # Greedy decoding is enough for short voice commands
+    silence_threshold: int = 500  # Peak int16 amplitude below which audio isn't decoded (0 disables)
+
+
 @dataclass
 class Settings:
     """Application settings loaded from settings.toml."""
@@ -39,6 +50,7 @@ class Settings:
     reminders: ReminderSettings
     wake_word: WakeWordSettings
     llm: LLMSettings
+    stt: STTSettings = field(default_factory=STTSettings)
     listening_timeout: float = 6.0  # Seconds to wait for a follow-up response
 
 
@@ -78,12 +90,22 @@ def load_settings(settings_path: str | Path = "settings.toml") -> Settings:
         model=llm_data.get("model", "gpt-3.5-turbo"),
     )
 
+    stt_data = data.get("stt", {})
+    stt_settings = STTSettings(
+        model=stt_data.get("model", "base.en"),
+        device=stt_data.get("device", "auto"),
+        compute_type=stt_data.get("compute_type", "auto"),
+        beam_size=stt_data.get("beam_size", 1),
+        silence_threshold=stt_data.get("silence_threshold", 500),
+    )
+
     listening_timeout_data = data.get("listening_timeout", 6.0)
 
     return Settings(
         reminders=reminder_settings,
         wake_word=wake_word_settings,
         llm=llm_settings,
+        stt=stt_settings,
         listening_timeout=listening_timeout_data,
     )
 
@@ -5,6 +5,7 @@ Handles human-in-the-loop confirmation for tool calls that
 require explicit user approval (e.g., creating reminders).
 """
 
+import logging
 from typing import TYPE_CHECKING
 
 from agent import PendingConfirmation, confirm_tool_call
@@ -18,6 +19,8 @@ if TYPE_CHECKING:
     from tts import InterruptibleSpeaker
     from wake_word import WakeWordListener
 
+log = logging.getLogger(__name__)
+
 # Timeout for confirmation responses
 CONFIRMATION_TIMEOUT = 10.0
 
@@ -66,52 +69,38 @@ class AwaitingConfirmationHandler(StateHandler):
             )
 
         # Speak the confirmation prompt - may be interrupted with captured audio
-        print(f"\n🤖 Rex: {self._pending.confirmation_prompt}\n")
+        log.info("\n🤖 Rex: %s\n", self._pending.confirmation_prompt)
         was_interrupted, captured_audio = self._speaker.speak_interruptibly(
             self._pending.confirmation_prompt
         )
 
         # Use captured audio if interrupted, otherwise listen for response
         if was_interrupted and captured_audio is not None and len(captured_audio) > 0:
-            print("🛑 Interrupted with response")
+            log.info("🛑 Interrupted with response")
             audio = captured_audio
             # Strip wake word since this came from interruption
             strip_wake_word = True
         else:
             # Listen for response
-            print("🎤 Listening for confirmation...")
+            log.info("🎤 Listening for confirmation...")
             audio = self._listener.listen_for_speech(timeout=CONFIRMATION_TIMEOUT)
             strip_wake_word = False
 
         if audio is None:
             # No response - treat as rejection
-            print("⏱️ No confirmation received, cancelling.")
-            response, history = confirm_tool_call(self._pending, confirmed=False)
-            ctx.conversation_history = history
-            return StateResult(
-                next_state=ConversationState.SPEAKING,
-                data={"response": response, "force_end_conversation": True},
-            )
+            return self._reject(ctx, "⏱️ No confirmation received, cancelling.")
 
         transcription = self._transcriber.transcribe(audio, strip_wake_word=strip_wake_word)
         if not transcription:
-            print("⏱️ Could not understand response, cancelling.")
-            response, history = confirm_tool_call(self._pending, confirmed=False)
-            ctx.conversation_history = history
-            return StateResult(
-                next_state=ConversationState.SPEAKING,
-                data={"response": response, "force_end_conversation": True},
-            )
+            return self._reject(ctx, "⏱️ Could not understand response, cancelling.")
 
-        print(f"\n💬 You said: {transcription}\n")
+        log.info("\n💬 You said: %s\n", transcription)
 
-        if is_confirmation(transcription):
-            print("✅ Confirmed!")
-            response, history = confirm_tool_call(self._pending, confirmed=True)
-        else:
-            print("❌ Cancelled.")
-            response, history = confirm_tool_call(self._pending, confirmed=False)
+        if not is_confirmation(transcription):
+            return self._reject(ctx, "❌ Cancelled.")
 
+        log.info("✅ Confirmed!")
+        response, history = confirm_tool_call(self._pending, confirmed=True)
         ctx.conversation_history = history
 
         return StateResult(
@@ -119,6 +108,16 @@ class AwaitingConfirmationHandler(StateHandler):
             data={"response": response, "force_end_conversation": True},
         )
 
+    def _reject(self, ctx: "AppContext", reason: str) -> StateResult:
+        """Cancel the pending tool call and speak the cancellation."""
+        log.info(reason)
+        response, history = confirm_tool_call(self._pending, confirmed=False)
+        ctx.conversation_history = history
+        return StateResult(
+            next_state=ConversationState.SPEAKING,
+            data={"response": response, "force_end_conversation": True},
+        )
+
     def exit(self, ctx: "AppContext") -> None:
         """Clear pending confirmation."""
         self._pending = None
@@ -5,17 +5,23 @@ Handles speech capture and transcription, either after wake word
 detection or during follow-up conversation.
 """
 
+import logging
 from typing import TYPE_CHECKING
 
-from core.state_machine import ConversationState, StateHandler, StateResult
+from core.state_machine import WAITING_RESULT, ConversationState, StateHandler, StateResult
 
 if TYPE_CHECKING:
     from core.context import AppContext
     from stt import Transcriber
     from wake_word import WakeWordListener
 
+log = logging.getLogger(__name__)
+
 # Phrases that end the conversation
-STOP_PHRASES = ("stop", "nevermind", "never mind", "cancel", "forget it")
+STOP_PHRASES = frozenset({"stop", "nevermind", "never mind", "cancel", "forget it"})
+
+# Phrases that silence a ringing timer
+TIMER_STOP_PHRASES = frozenset({"stop", "stop the timer"})
 
 
 class ListeningHandler(StateHandler):
@@ -61,16 +67,19 @@ class ListeningHandler(StateHandler):
         if self._audio is None:
             # Play ready tone BEFORE waiting for speech so user knows Rex is listening
             ctx.audio_manager.play_listening_tone()
-            print("🎤 Listening for response...")
+            log.info("🎤 Listening for response...")
             self._audio = self._listener.listen_for_speech(
                 timeout=ctx.settings.listening_timeout, play_tones=True
             )
 
             if self._audio is None:
-                print("⏱️ No response received, ending conversation.")
+                log.info("⏱️ No response received, ending conversation.")
                 # Play done tone to indicate we're no longer listening
                 ctx.audio_manager.play_done_tone()
-                return StateResult(next_state=ConversationState.WAITING_FOR_WAKE_WORD)
+                return WAITING_RESULT
+
+        # Conversation state can't change while we're in this handler
+        in_conversation = ctx.is_in_conversation()
 
         # Transcribe the audio
         strip_wake_word = self._is_wake_word_trigger
@@ -78,29 +87,29 @@ class ListeningHandler(StateHandler):
 
         if not transcription:
             # Empty transcription - go back to appropriate state
-            if ctx.is_in_conversation():
+            if in_conversation:
                 # Stay listening for follow-up
                 return StateResult(
                     next_state=ConversationState.LISTENING,
                     data={"audio": None, "is_wake_word_trigger": False},
                 )
             else:
-                return StateResult(next_state=ConversationState.WAITING_FOR_WAKE_WORD)
+                return WAITING_RESULT
 
-        print(f"\n💬 You said: {transcription}\n")
+        log.info("\n💬 You said: %s\n", transcription)
 
-        # Handle special commands
-        normalized = transcription.strip().lower()
+        # Handle special commands (the transcriber already strips whitespace)
+        normalized = transcription.lower()
 
         # Timer stop command (works anytime)
-        if normalized in ("stop", "stop the timer"):
+        if normalized in TIMER_STOP_PHRASES:
             if ctx.timer_manager and ctx.timer_manager.stop_any_ringing():
-                print("🔕 Timer alarm stopped.")
-            return StateResult(next_state=ConversationState.WAITING_FOR_WAKE_WORD)
+                log.info("🔕 Timer alarm stopped.")
+            return WAITING_RESULT
 
         # Stop phrases end conversation (only during follow-up)
-        if ctx.is_in_conversation() and normalized in STOP_PHRASES:
-            return StateResult(next_state=ConversationState.WAITING_FOR_WAKE_WORD)
+        if in_conversation and normalized in STOP_PHRASES:
+            return WAITING_RESULT
 
         # Pass transcription to processing state
         return StateResult(
@@ -5,6 +5,9 @@ Provides common phrase sets and matching functions used across
 multiple state handlers (confirmation, reminder delivery, etc.).
 """
 
+import re
+from functools import lru_cache
+
 CONFIRM_PHRASES = (
     "yes", "yeah", "yep", "sure", "okay", "ok",
     "confirm", "do it", "go ahead", "proceed",
@@ -14,14 +17,28 @@ CONFIRM_PHRASES = (
 REJECT_PHRASES = ("no", "nope", "cancel", "nevermind", "never mind", "don't", "stop")
 
 
+def phrase_alternation(phrases: tuple[str, ...]) -> str:
+    """Build a whole-word regex alternation matching any of the phrases."""
+    alternation = "|".join(re.escape(phrase) for phrase in phrases)
+    return rf"\b(?:{alternation})\b"
+
+
+def _compile_phrases(phrases: tuple[str, ...]) -> re.Pattern:
+    """Compile phrases into a single case-insensitive whole-word pattern."""
+    return re.compile(phrase_alternation(phrases), re.IGNORECASE)
+
+
+_CONFIRM_RE = _compile_phrases(CONFIRM_PHRASES)
+_REJECT_RE = _compile_phrases(REJECT_PHRASES)
+
+
+@lru_cache(maxsize=256)
 def is_confirmation(text: str) -> bool:
     """Check if text contains a confirmation phrase."""
-    normalized = text.strip().lower()
-    return any(phrase in normalized for phrase in CONFIRM_PHRASES)
+    return _CONFIRM_RE.search(text) is not None
 
 
+@lru_cache(maxsize=256)
 def is_rejection(text: str) -> bool:
     """Check if text contains a rejection phrase."""
-    normalized = text.strip().lower()
-    return any(phrase in normalized for phrase in REJECT_PHRASES)
-
+    return _REJECT_RE.search(text) is not None
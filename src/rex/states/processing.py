@@ -4,15 +4,18 @@ Processing state handler.
 Sends the user's query to the agent and handles the response.
 """
 
+import logging
 from typing import TYPE_CHECKING
 
 from agent import PendingConfirmation, run_voice_agent
 from audio import ThinkingTone
-from core.state_machine import ConversationState, StateHandler, StateResult
+from core.state_machine import WAITING_RESULT, ConversationState, StateHandler, StateResult
 
 if TYPE_CHECKING:
     from core.context import AppContext
 
+log = logging.getLogger(__name__)
+
 
 class ProcessingHandler(StateHandler):
     """
@@ -46,10 +49,10 @@ class ProcessingHandler(StateHandler):
             WAITING_FOR_WAKE_WORD on error
         """
         if not self._transcription:
-            return StateResult(next_state=ConversationState.WAITING_FOR_WAKE_WORD)
+            return WAITING_RESULT
 
         try:
-            print("🤔 Thinking...")
+            log.info("🤔 Thinking...")
 
             # Play thinking tone while waiting for LLM
             with ThinkingTone(ctx.audio_manager):
@@ -77,11 +80,8 @@ class ProcessingHandler(StateHandler):
                 data={"response": response},
             )
 
-        except Exception as e:
-            print(f"❌ Agent error: {e}")
-            import traceback
-
-            traceback.print_exc()
+        except Exception:
+            log.exception("❌ Agent error")
 
             return StateResult(
                 next_state=ConversationState.SPEAKING,
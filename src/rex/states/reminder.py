@@ -4,13 +4,14 @@ Delivering reminder state handler.
 Handles proactive reminder delivery when a reminder becomes due.
 """
 
+import logging
 import re
 from typing import TYPE_CHECKING
 
-from core.state_machine import ConversationState, StateHandler, StateResult
+from core.state_machine import WAITING_RESULT, ConversationState, StateHandler, StateResult
 from tts import speak_text
 
-from .phrases import is_confirmation, is_rejection
+from .phrases import CONFIRM_PHRASES, REJECT_PHRASES, phrase_alternation
 
 if TYPE_CHECKING:
     from core.context import AppContext
@@ -19,10 +20,31 @@ if TYPE_CHECKING:
     from tts import InterruptibleSpeaker
     from wake_word import WakeWordListener
 
+log = logging.getLogger(__name__)
+
 # Timeout for reminder responses
 REMINDER_RESPONSE_TIMEOUT = 5.0
 
 
+# Snooze phrasings, most specific first; exactly one group captures the minutes
+_SNOOZE_PATTERN = re.compile(
+    r"(?:remind|tell|ask)\s+me\s+(?:again\s+)?in\s+(\d+)\s*(?:minute|min)"
+    r"|(?:snooze|delay|postpone)(?:\s+(?:it|for))?\s+(\d+)\s*(?:minute|min)"
+    r"|(\d+)\s*(?:minute|min)(?:\s+(?:later|from now))?",
+    re.IGNORECASE,
+)
+
+# Non-committal replies that should also push the reminder back
+DEFER_PHRASES = ("later", "not now")
+
+# Classifies a reply in one scan; the first phrase spoken decides the group
+_RESPONSE_PATTERN = re.compile(
+    rf"(?P<confirm>{phrase_alternation(CONFIRM_PHRASES)})"
+    rf"|(?P<defer>{phrase_alternation(REJECT_PHRASES + DEFER_PHRASES)})",
+    re.IGNORECASE,
+)
+
+
 def _parse_snooze_duration(text: str) -> int | None:
     """
     Parse a snooze duration from text like "remind me in 30 minutes".
@@ -30,20 +52,10 @@ def _parse_snooze_duration(text: str) -> int | None:
     Returns:
         Number of minutes, or None if not a snooze request.
     """
-    patterns = [
-        r"(?:remind|tell|ask)\s+me\s+(?:again\s+)?in\s+(\d+)\s*(?:minute|min)",
-        r"(?:snooze|delay|postpone)(?:\s+(?:it|for))?\s+(\d+)\s*(?:minute|min)",
-        r"(\d+)\s*(?:minute|min)(?:\s+(?:later|from now))?",
-    ]
-
-    normalized = text.strip().lower()
-
-    for pattern in patterns:
-        match = re.search(pattern, normalized)
-        if match:
-            return int(match.group(1))
-
-    return None
+    match = _SNOOZE_PATTERN.search(text)
+    if match is None:
+        return None
+    return int(next(group for group in match.groups() if group is not None))
 
 
 class DeliveringReminderHandler(StateHandler):
@@ -92,75 +104,77 @@ class DeliveringReminderHandler(StateHandler):
             WAITING_FOR_WAKE_WORD after handling (or scheduling retry)
         """
         if self._delivery is None:
-            return StateResult(next_state=ConversationState.WAITING_FOR_WAKE_WORD)
+            return WAITING_RESULT
 
         reminder = self._delivery.reminder
 
         # Play ding sound
-        print("🔔 Reminder!")
+        log.info("🔔 Reminder!")
         self._scheduler.play_ding()
 
         # Speak the reminder - may be interrupted with captured audio
         reminder_text = f"You have a reminder: {reminder.message}. Would you like to clear this reminder?"
-        print(f"\n🤖 Rex: {reminder_text}\n")
+        log.info("\n🤖 Rex: %s\n", reminder_text)
         was_interrupted, captured_audio = self._speaker.speak_interruptibly(reminder_text)
 
         # Use captured audio if interrupted, otherwise listen for response
         if was_interrupted and captured_audio is not None and len(captured_audio) > 0:
-            print("🛑 Interrupted with response")
+            log.info("🛑 Interrupted with response")
             audio = captured_audio
             strip_wake_word = True
         else:
             # Listen for response
-            print("🎤 Listening for response...")
+            log.info("🎤 Listening for response...")
             audio = self._listener.listen_for_speech(timeout=REMINDER_RESPONSE_TIMEOUT)
             strip_wake_word = False
 
         if audio is None:
             # No response - schedule retry
-            print("⏱️ No response, will retry later.")
+            log.info("⏱️ No response, will retry later.")
             self._scheduler.schedule_retry(reminder.id)
-            return StateResult(next_state=ConversationState.WAITING_FOR_WAKE_WORD)
+            return WAITING_RESULT
 
         transcription = self._transcriber.transcribe(audio, strip_wake_word=strip_wake_word)
         if not transcription:
-            print("⏱️ Could not understand response, will retry later.")
+            log.info("⏱️ Could not understand response, will retry later.")
             self._scheduler.schedule_retry(reminder.id)
-            return StateResult(next_state=ConversationState.WAITING_FOR_WAKE_WORD)
+            return WAITING_RESULT
 
-        print(f"\n💬 You said: {transcription}\n")
-        normalized = transcription.strip().lower()
+        log.info("\n💬 You said: %s\n", transcription)
 
         # Check for snooze request
         snooze_minutes = _parse_snooze_duration(transcription)
         if snooze_minutes:
             self._scheduler.snooze_reminder(reminder.id, snooze_minutes)
             response = f"Okay, I'll remind you again in {snooze_minutes} minutes."
-            print(f"\n🤖 Rex: {response}\n")
+            log.info("\n🤖 Rex: %s\n", response)
             speak_text(response, self._voice, ctx.audio_manager)
-            return StateResult(next_state=ConversationState.WAITING_FOR_WAKE_WORD)
+            return WAITING_RESULT
+
+        response_match = _RESPONSE_PATTERN.search(transcription)
+        category = response_match.lastgroup if response_match else None
 
         # Check for clear/acknowledge
-        if is_confirmation(transcription):
+        if category == "confirm":
             self._scheduler.mark_delivered(reminder.id)
             response = "Reminder cleared."
-            print(f"\n🤖 Rex: {response}\n")
+            log.info("\n🤖 Rex: %s\n", response)
             speak_text(response, self._voice, ctx.audio_manager)
-            return StateResult(next_state=ConversationState.WAITING_FOR_WAKE_WORD)
+            return WAITING_RESULT
 
         # Check for explicit rejection/snooze without time
-        if is_rejection(transcription) or "later" in normalized or "not now" in normalized:
+        if category == "defer":
             self._scheduler.schedule_retry(reminder.id)
             retry_mins = ctx.settings.reminders.retry_minutes if ctx.settings else 10
             response = f"Okay, I'll remind you again in {retry_mins} minutes."
-            print(f"\n🤖 Rex: {response}\n")
+            log.info("\n🤖 Rex: %s\n", response)
             speak_text(response, self._voice, ctx.audio_manager)
-            return StateResult(next_state=ConversationState.WAITING_FOR_WAKE_WORD)
+            return WAITING_RESULT
 
         # Unclear response - retry later
-        print("⏱️ Unclear response, will retry later.")
+        log.info("⏱️ Unclear response, will retry later.")
         self._scheduler.schedule_retry(reminder.id)
-        return StateResult(next_state=ConversationState.WAITING_FOR_WAKE_WORD)
+        return WAITING_RESULT
 
     def exit(self, ctx: "AppContext") -> None:
         """Unmute timer and clear delivery info."""
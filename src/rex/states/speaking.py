@@ -4,16 +4,19 @@ Speaking state handler.
 Handles TTS playback of the agent's response with interruption support.
 """
 
+import logging
 from typing import TYPE_CHECKING
 
 from langchain_core.messages import AIMessage
 
-from core.state_machine import ConversationState, StateHandler, StateResult
+from core.state_machine import WAITING_RESULT, ConversationState, StateHandler, StateResult
 
 if TYPE_CHECKING:
     from core.context import AppContext
     from tts import InterruptibleSpeaker
 
+log = logging.getLogger(__name__)
+
 
 class SpeakingHandler(StateHandler):
     """
@@ -51,15 +54,15 @@ class SpeakingHandler(StateHandler):
             WAITING_FOR_WAKE_WORD if conversation should end
         """
         if not self._response:
-            return StateResult(next_state=ConversationState.WAITING_FOR_WAKE_WORD)
+            return WAITING_RESULT
 
-        print(f"\n🤖 Rex: {self._response}\n")
+        log.info("\n🤖 Rex: %s\n", self._response)
 
         # Speak with interruption support - returns (was_interrupted, captured_audio)
         was_interrupted, captured_audio = self._speaker.speak_interruptibly(self._response)
 
         if was_interrupted:
-            print("🛑 Interrupted!")
+            log.info("🛑 Interrupted!")
 
             # Mark the last message as interrupted
             if ctx.conversation_history and isinstance(ctx.conversation_history[-1], AIMessage):
@@ -79,10 +82,10 @@ class SpeakingHandler(StateHandler):
 
         # Check if we should continue the conversation
         if self._force_end_conversation:
-            return StateResult(next_state=ConversationState.WAITING_FOR_WAKE_WORD)
+            return WAITING_RESULT
 
         # Continue if Rex asked a question
-        should_continue = self._response.strip().endswith("?")
+        should_continue = self._response.rstrip().endswith("?")
 
         if should_continue:
             return StateResult(
@@ -90,7 +93,7 @@ class SpeakingHandler(StateHandler):
                 data={"audio": None, "is_wake_word_trigger": False},
             )
         else:
-            return StateResult(next_state=ConversationState.WAITING_FOR_WAKE_WORD)
+            return WAITING_RESULT
 
     def exit(self, ctx: "AppContext") -> None:
         """Clear response."""
@@ -4,15 +4,18 @@ Waiting for wake word state handler.
 This is the idle state where Rex listens for the wake word to start a conversation.
 """
 
+import logging
 from typing import TYPE_CHECKING
 
-from core.state_machine import ConversationState, StateHandler, StateResult
+from core.state_machine import SHUTDOWN_RESULT, WAITING_RESULT, ConversationState, StateHandler, StateResult
 
 if TYPE_CHECKING:
     from core.context import AppContext
     from rex.reminder_scheduler import ReminderScheduler
     from wake_word import WakeWordListener
 
+log = logging.getLogger(__name__)
+
 
 class WaitingForWakeWordHandler(StateHandler):
     """
@@ -34,14 +37,14 @@ class WaitingForWakeWordHandler(StateHandler):
         return ConversationState.WAITING_FOR_WAKE_WORD
 
     def enter(self, ctx: "AppContext", data: dict | None = None) -> None:
-        """Reset conversation state and print listening message."""
+        """Reset conversation state and announce that Rex is listening."""
         ctx.reset_conversation()
 
         # Unmute timer sounds when returning to idle
         if ctx.timer_manager:
             ctx.timer_manager.unmute()
 
-        print(f"🎤 Listening for '{ctx.settings.wake_word.display_name}'...")
+        log.info("🎤 Listening for '%s'...", ctx.settings.wake_word.display_name)
 
     def process(self, ctx: "AppContext") -> StateResult:
         """
@@ -81,11 +84,11 @@ class WaitingForWakeWordHandler(StateHandler):
                         data={"delivery": delivery},
                     )
             # Otherwise it's a shutdown
-            return StateResult(next_state=ConversationState.SHUTTING_DOWN)
+            return SHUTDOWN_RESULT
 
         if audio is None:
             # No audio captured, stay in waiting state
-            return StateResult(next_state=ConversationState.WAITING_FOR_WAKE_WORD)
+            return WAITING_RESULT
 
         # Wake word detected with audio captured
         return StateResult(
@@ -36,6 +36,10 @@ async def lifespan(app: FastAPI):
     log.info("Loading Kokoro voice...")
     app.state.tts_voice = load_voice()
 
+    # Whisper loads in the background alongside the voice; raises (and aborts
+    # startup) if it failed, rather than failing every transcription request
+    app.state.transcriber.wait_until_ready()
+
     log.info("Building voice agent...")
     bus = EventBus()
     # The audio manager is intentionally left out — the laptop never plays
@@ -56,6 +60,7 @@ async def lifespan(app: FastAPI):
             timer_mgr.cleanup()
         except Exception:
             log.exception("timer cleanup failed")
+        reminder_mgr.close()
 
 
 app = FastAPI(title="rex-server", lifespan=lifespan)
@@ -55,7 +55,8 @@ async def transcribe(
         samples = _resample_linear(samples, sr, 16000)
 
     t0 = time.monotonic()
-    text = transcriber.transcribe(samples, strip_wake_word=True)
+    # Uploaded clips aren't endpointed by our listener, so let Whisper trim silence
+    text = transcriber.transcribe(samples, strip_wake_word=True, vad_filter=True)
     dt_ms = int((time.monotonic() - t0) * 1000)
     return STTResponse(text=text, duration_ms=dt_ms)
 
@@ -3,61 +3,185 @@ Speech-to-Text transcription using faster-whisper.
 """
 
 import re
+import threading
+from collections.abc import Iterator
 
+import ctranslate2
 import numpy as np
 from faster_whisper import WhisperModel
 
+# Wake word plus the common variations Whisper might produce
+_WAKE_WORD_PATTERN = re.compile(r"^(?:hey|hay)\s*(?:rex|racks|wrecks)[,.\s]*", re.IGNORECASE)
+
+# Scale factor from int16 PCM to float32 in [-1, 1)
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
+# Initial capacity of the conversion buffer (30s at 16kHz); grows for longer clips
+_SCRATCH_SAMPLES = 16000 * 30
+
+
+def _resolve_device(device: str, compute_type: str) -> tuple[str, str]:
+    """Resolve "auto" device/compute type to CUDA + float16 or CPU + int8."""
+    if device == "auto":
+        device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    if compute_type == "auto":
+        compute_type = "float16" if device == "cuda" else "int8"
+    return device, compute_type
+
 
 class Transcriber:
     """Transcribes audio using Whisper."""
 
-    def __init__(self):
-        print("Loading Whisper model (this may take a moment on first run)...")
-        self._model = WhisperModel("small", device="cpu", compute_type="int8")
+    def __init__(
+        self,
+        model: str = "base.en",
+        device: str = "auto",
+        compute_type: str = "auto",
+        beam_size: int = 1,
+        silence_threshold: int = 500,
+    ):
+        """
+        Initialize the transcriber.
 
-    def transcribe(self, audio_data: np.ndarray, strip_wake_word: bool = True) -> str:
+        Args:
+            model: Whisper model size (English-only "base.en" suits short voice commands)
+            device: "cuda", "cpu", or "auto" to use CUDA when available
+            compute_type: CTranslate2 compute type, or "auto" for float16 on CUDA / int8 on CPU
+            beam_size: Decoding beam size (1 = greedy)
+            silence_threshold: Peak int16 amplitude below which audio is treated as
+                silence and not decoded at all (0 disables the check)
+        """
+        self._beam_size = beam_size
+        self._silence_threshold = silence_threshold
+        self._model: WhisperModel | None = None
+        self._load_error: Exception | None = None
+        self._ready = threading.Event()
+        self._scratch = np.empty(_SCRATCH_SAMPLES, dtype=np.float32)
+
+        # Load and warm up in the background so startup can continue meanwhile
+        threading.Thread(
+            target=self._load,
+            args=(model, *_resolve_device(device, compute_type)),
+            daemon=True,
+        ).start()
+
+    def _load(self, model: str, device: str, compute_type: str) -> None:
+        """Load the Whisper model and run one warmup pass over silence."""
+        try:
+            print(f"Loading Whisper {model} model on {device} (this may take a moment on first run)...")
+            self._model = WhisperModel(model, device=device, compute_type=compute_type)
+
+            # The first inference is much slower than later ones; pay that cost now
+            segments, _ = self._model.transcribe(np.zeros(16000, dtype=np.float32), language="en")
+            for _ in segments:
+                pass
+        except Exception as e:
+            self._load_error = e
+        finally:
+            self._ready.set()
+
+    def wait_until_ready(self, timeout: float | None = None) -> bool:
+        """
+        Wait for the background model load and warmup to finish.
+
+        Args:
+            timeout: Maximum seconds to wait (None for indefinite)
+
+        Returns:
+            True if the model is loaded, False if timeout occurred.
+
+        Raises:
+            RuntimeError: If the model failed to load.
+        """
+        if not self._ready.wait(timeout=timeout):
+            return False
+        if self._load_error is not None:
+            raise RuntimeError("Whisper model failed to load") from self._load_error
+        return True
+
+    def transcribe(self, audio_data: np.ndarray, strip_wake_word: bool = True, vad_filter: bool = False) -> str:
         """
         Transcribe audio data to text.
 
         Args:
             audio_data: numpy array of int16 audio samples at 16kHz
+                (float32 samples already in [-1, 1] are used as-is)
             strip_wake_word: if True, remove "hey rex" from start of transcription
+            vad_filter: if True, run Silero VAD over the clip before decoding; only
+                needed for audio that wasn't already endpointed by the listener
 
         Returns:
             Transcribed text, or empty string if no speech detected.
         """
-        if len(audio_data) == 0:
-            return ""
+        return " ".join(self.iter_transcribe(audio_data, strip_wake_word=strip_wake_word, vad_filter=vad_filter))
+
+    def iter_transcribe(
+        self, audio_data: np.ndarray, strip_wake_word: bool = True, vad_filter: bool = False
+    ) -> Iterator[str]:
+        """
+        Transcribe audio data, yielding text segment by segment as Whisper decodes it.
+
+        Lets callers start work on the first segment while later ones are still
+        being decoded.
 
-        # Convert int16 to float32 for Whisper
-        audio_float = audio_data.astype(np.float32) / 32768.0
+        Args:
+            audio_data: numpy array of int16 audio samples at 16kHz
+                (float32 samples already in [-1, 1] are used as-is)
+            strip_wake_word: if True, remove "hey rex" from start of the first
+                non-empty segment
+            vad_filter: if True, run Silero VAD over the clip before decoding; only
+                needed for audio that wasn't already endpointed by the listener
+
+        Yields:
+            Non-empty segment text, stripped of surrounding whitespace.
+        """
+        if len(audio_data) == 0 or self._is_silent(audio_data):
+            return
+
+        self.wait_until_ready()
+
+        # Convert int16 to float32 for Whisper, casting and scaling in one pass into a
+        # reused buffer. faster-whisper extracts features before returning, so the
+        # buffer is free again once transcribe() below has returned.
+        if audio_data.dtype == np.float32:
+            audio_float = audio_data
+        else:
+            n = len(audio_data)
+            if n > self._scratch.size:
+                self._scratch = np.empty(n, dtype=np.float32)
+            audio_float = self._scratch[:n]
+            np.multiply(audio_data, _INT16_SCALE, out=audio_float, dtype=np.float32)
 
         segments, _ = self._model.transcribe(
             audio_float,
             language="en",
-            vad_filter=True,
+            beam_size=self._beam_size,
+            vad_filter=vad_filter,
         )
 
-        text = " ".join(seg.text for seg in segments).strip()
-
-        if strip_wake_word:
-            text = self._strip_wake_word(text)
-
-        return text
-
-    def _strip_wake_word(self, text: str) -> str:
+        # faster-whisper decodes lazily, so each segment is yielded as soon as it's ready
+        for seg in segments:
+            text = seg.text.strip()
+            if strip_wake_word:
+                text = self._strip_wake_word(text)
+            if text:
+                # The wake word can only lead the first segment that carries speech
+                strip_wake_word = False
+                yield text
+
+    def _is_silent(self, audio_data: np.ndarray) -> bool:
+        """Check whether the clip's peak amplitude stays under the silence threshold."""
+        threshold = self._silence_threshold
+        if audio_data.dtype == np.float32:
+            threshold = threshold * _INT16_SCALE
+
+        # Negate as a Python float; np.abs or int16 negation overflows on -32768
+        return max(float(audio_data.max()), -float(audio_data.min())) < threshold
+
+    @staticmethod
+    def _strip_wake_word(text: str) -> str:
         """Remove wake word variations from the start of transcription."""
-        # Common variations Whisper might produce
-        patterns = [
-            r"^hey\s*rex[,.\s]*",
-            r"^hay\s*rex[,.\s]*",
-            r"^hey\s*racks[,.\s]*",
-            r"^hey\s*wrecks[,.\s]*",
-        ]
-        result = text
-        for pattern in patterns:
-            result = re.sub(pattern, "", result, flags=re.IGNORECASE)
-        result = result.strip()
+        result = _WAKE_WORD_PATTERN.sub("", text, count=1).strip()
 
         # Capitalize the first letter since the wake word was at the start
         if result:
@@ -1,8 +1,4 @@
-"""Pytest configuration and shared fixtures."""
+"""Pytest configuration and shared fixtures.
 
-import sys
-from pathlib import Path
-
-# Add src directory to path so tests can import modules
-src_path = Path(__file__).parent.parent
-sys.path.insert(0, str(src_path))
+src/ is put on the import path by pythonpath in pyproject.toml's [tool.pytest.ini_options].
+"""
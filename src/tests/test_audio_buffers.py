@@ -0,0 +1,92 @@
+"""Tests for the audio buffers used by the wake word capture loops."""
+
+import numpy as np
+
+from wake_word.wake_word_listener import AudioAccumulator, RollingAudioBuffer
+
+
+class TestAudioAccumulator:
+    """Tests for AudioAccumulator class."""
+
+    def test_empty(self):
+        audio = AudioAccumulator()
+
+        assert len(audio) == 0
+        assert audio.get().dtype == np.int16
+        assert len(audio.get()) == 0
+
+    def test_append_keeps_order(self):
+        audio = AudioAccumulator()
+        first = np.arange(100, dtype=np.int16)
+        second = np.arange(100, 250, dtype=np.int16)
+
+        audio.append(first)
+        audio.append(second)
+
+        assert np.array_equal(audio.get(), np.concatenate([first, second]))
+
+    def test_grows_past_initial_capacity(self):
+        audio = AudioAccumulator(capacity=8)
+        samples = np.arange(1000, dtype=np.int16)
+
+        for start in range(0, 1000, 300):
+            audio.append(samples[start : start + 300])
+
+        assert len(audio) == 1000
+        assert np.array_equal(audio.get(), samples)
+
+
+class TestRollingAudioBuffer:
+    """Tests for RollingAudioBuffer class."""
+
+    @staticmethod
+    def held(buffer: RollingAudioBuffer) -> np.ndarray:
+        return np.concatenate(buffer.views())
+
+    def test_holds_samples_until_full(self):
+        buffer = RollingAudioBuffer(100)
+        samples = np.arange(60, dtype=np.int16)
+
+        buffer.extend(samples)
+
+        assert len(buffer) == 60
+        assert np.array_equal(self.held(buffer), samples)
+
+    def test_keeps_newest_samples_across_wraparound(self):
+        buffer = RollingAudioBuffer(100)
+        samples = np.arange(250, dtype=np.int16)
+
+        for start in range(0, 250, 30):
+            buffer.extend(samples[start : start + 30])
+
+        assert len(buffer) == 100
+        assert np.array_equal(self.held(buffer), samples[-100:])
+
+    def test_chunk_larger_than_capacity(self):
+        buffer = RollingAudioBuffer(100)
+        buffer.extend(np.arange(30, dtype=np.int16))
+        samples = np.arange(1000, 1250, dtype=np.int16)
+
+        buffer.extend(samples)
+
+        assert np.array_equal(self.held(buffer), samples[-100:])
+
+    def test_keep_last(self):
+        buffer = RollingAudioBuffer(100)
+        samples = np.arange(170, dtype=np.int16)
+        buffer.extend(samples)
+
+        buffer.keep_last(40)
+        assert np.array_equal(self.held(buffer), samples[-40:])
+
+        buffer.extend(samples[:10])
+        assert np.array_equal(self.held(buffer), np.concatenate([samples[-40:], samples[:10]]))
+
+    def test_clear(self):
+        buffer = RollingAudioBuffer(100)
+        buffer.extend(np.arange(50, dtype=np.int16))
+
+        buffer.clear()
+
+        assert len(buffer) == 0
+        assert len(self.held(buffer)) == 0
@@ -0,0 +1,42 @@
+"""Tests for queued console logging."""
+
+import logging
+
+import pytest
+
+from rex.logsetup import setup_logging, shutdown_logging
+
+
+@pytest.fixture
+def rex_logger():
+    """Restore the rex logger's handlers after each test."""
+    logger = logging.getLogger("rex")
+    handlers, propagate, level = list(logger.handlers), logger.propagate, logger.level
+    yield logger
+    shutdown_logging()
+    logger.handlers[:] = handlers
+    logger.propagate = propagate
+    logger.setLevel(level)
+
+
+def test_records_are_written_by_background_listener(rex_logger, capsys):
+    setup_logging()
+    logging.getLogger("rex.states.listening").info("🎤 Listening for response...")
+    shutdown_logging()
+
+    assert capsys.readouterr().out == "🎤 Listening for response...\n"
+
+
+def test_setup_is_idempotent(rex_logger):
+    setup_logging()
+    setup_logging()
+
+    assert len(rex_logger.handlers) == 1
+
+
+def test_third_party_loggers_are_not_captured(rex_logger, capsys):
+    setup_logging()
+    logging.getLogger("httpx").info("HTTP Request: POST /v1/chat/completions")
+    shutdown_logging()
+
+    assert capsys.readouterr().out == ""
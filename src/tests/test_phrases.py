@@ -0,0 +1,39 @@
+"""Tests for confirmation/rejection phrase matching."""
+
+from rex.states.phrases import is_confirmation, is_rejection
+
+
+class TestIsConfirmation:
+    """Tests for is_confirmation function."""
+
+    def test_simple_confirmations(self):
+        assert is_confirmation("yes")
+        assert is_confirmation("Yeah, go ahead.")
+        assert is_confirmation("OK")
+        assert is_confirmation("okay sure")
+
+    def test_multi_word_phrases(self):
+        assert is_confirmation("please do it")
+        assert is_confirmation("Got it, thanks")
+
+    def test_matches_whole_words_only(self):
+        assert not is_confirmation("look at the yesterday news")
+
+    def test_no_confirmation(self):
+        assert not is_confirmation("what time is it")
+        assert not is_confirmation("")
+
+
+class TestIsRejection:
+    """Tests for is_rejection function."""
+
+    def test_simple_rejections(self):
+        assert is_rejection("no")
+        assert is_rejection("Nope.")
+        assert is_rejection("cancel that")
+        assert is_rejection("never mind")
+        assert is_rejection("don't do it")
+
+    def test_matches_whole_words_only(self):
+        assert not is_rejection("I know")
+        assert not is_rejection("nothing else")
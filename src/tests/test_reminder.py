@@ -1,5 +1,6 @@
 """Tests for reminder tools: ReminderManager, CRUD operations, and datetime parsing."""
 
+import sqlite3
 from datetime import datetime, timedelta
 
 import pytest
@@ -25,6 +26,16 @@ class TestParseDatetime:
         assert result.hour == 14
         assert result.minute == 30
 
+    def test_iso_format_keeps_24_hour_time(self):
+        # ISO input skips the AM/PM guessing, even for dates in the future
+        next_year = datetime.now().year + 1
+        assert parse_datetime(f"{next_year}-03-01T14:30") == datetime(next_year, 3, 1, 14, 30)
+
+    def test_iso_format_with_offset_becomes_local(self):
+        result = parse_datetime("2025-12-25T14:30:00+00:00")
+        assert result is not None
+        assert result.tzinfo is None
+
     def test_time_only(self):
         result = parse_datetime("3pm")
         assert result is not None
@@ -64,14 +75,14 @@ class TestReminderManager:
     """Tests for ReminderManager class."""
 
     @pytest.fixture
-    def fresh_reminder_manager(self, tmp_path):
-        """Create a fresh ReminderManager with a temp database."""
-        # Create manager with temp db path
-        db_path = tmp_path / "test_reminders.db"
-        manager = ReminderManager(db_path=db_path)
+    def fresh_reminder_manager(self):
+        """Create a fresh ReminderManager with an in-memory database."""
+        manager = ReminderManager(db_path=":memory:")
 
         yield manager
 
+        manager.close()
+
     def test_create_reminder(self, fresh_reminder_manager):
         due = datetime.now() + timedelta(hours=1)
         reminder = fresh_reminder_manager.create_reminder("Test reminder", due)
@@ -98,20 +109,40 @@ class TestReminderManager:
         assert reminders == []
 
     def test_list_reminders(self, fresh_reminder_manager):
-        due1 = datetime.now() + timedelta(hours=1)
-        due2 = datetime.now() + timedelta(hours=2)
-        fresh_reminder_manager.create_reminder("First", due1)
-        fresh_reminder_manager.create_reminder("Second", due2)
+        now = datetime.now()
+        due1 = now + timedelta(hours=1)
+        due2 = now + timedelta(hours=2)
+        fresh_reminder_manager.create_reminders([("First", due1), ("Second", due2)])
 
         reminders = fresh_reminder_manager.list_reminders()
         assert len(reminders) == 2
         assert reminders[0].message == "First"  # Ordered by due time
         assert reminders[1].message == "Second"
 
+    def test_create_reminders_batch(self, fresh_reminder_manager):
+        due = datetime.now() + timedelta(hours=1)
+        created = fresh_reminder_manager.create_reminders([("A", due), ("B", due + timedelta(minutes=5))])
+
+        assert [r.message for r in created] == ["A", "B"]
+        assert [r.id for r in fresh_reminder_manager.list_reminders()] == [r.id for r in created]
+        assert fresh_reminder_manager.get_next_pending_time() == due
+
+    def test_create_reminders_empty(self, fresh_reminder_manager):
+        assert fresh_reminder_manager.create_reminders([]) == []
+
+    def test_create_reminders_ids_match_rows(self, fresh_reminder_manager):
+        due = datetime.now() + timedelta(hours=1)
+        first = fresh_reminder_manager.create_reminder("Deleted", due)
+        fresh_reminder_manager.delete_reminder(first.id)
+
+        created = fresh_reminder_manager.create_reminders([("A", due), ("B", due), ("C", due)])
+
+        for reminder in created:
+            assert fresh_reminder_manager.get_reminder(reminder.id).message == reminder.message
+
     def test_list_reminders_by_status(self, fresh_reminder_manager):
         due = datetime.now() + timedelta(hours=1)
-        r1 = fresh_reminder_manager.create_reminder("Pending", due)
-        r2 = fresh_reminder_manager.create_reminder("Cleared", due)
+        r1, r2 = fresh_reminder_manager.create_reminders([("Pending", due), ("Cleared", due)])
         fresh_reminder_manager.clear_reminder(r2.id)
 
         pending = fresh_reminder_manager.list_reminders(status=ReminderStatus.PENDING)
@@ -122,16 +153,29 @@ class TestReminderManager:
         assert len(cleared) == 1
         assert cleared[0].id == r2.id
 
-    def test_get_due_reminders(self, fresh_reminder_manager):
-        past = datetime.now() - timedelta(hours=1)
-        future = datetime.now() + timedelta(hours=1)
+    @pytest.fixture
+    def frozen_now(self, monkeypatch):
+        """Pin the reminder module's clock so due-time comparisons are exact."""
+        frozen = datetime(2025, 1, 1, 12, 0, 0)
+
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return frozen
+
+        monkeypatch.setattr("agent.tools.reminder.datetime", FrozenDatetime)
+        return frozen
 
-        r1 = fresh_reminder_manager.create_reminder("Past due", past)
-        fresh_reminder_manager.create_reminder("Not yet due", future)
+    def test_get_due_reminders(self, fresh_reminder_manager, frozen_now):
+        past = frozen_now - timedelta(hours=1)
+        future = frozen_now + timedelta(hours=1)
+
+        r1, r2, _ = fresh_reminder_manager.create_reminders(
+            [("Past due", past), ("Due now", frozen_now), ("Not yet due", future)]
+        )
 
         due = fresh_reminder_manager.get_due_reminders()
-        assert len(due) == 1
-        assert due[0].id == r1.id
+        assert [r.id for r in due] == [r1.id, r2.id]
 
     def test_update_reminder_message(self, fresh_reminder_manager):
         due = datetime.now() + timedelta(hours=1)
@@ -143,14 +187,21 @@ class TestReminderManager:
         assert updated.due_datetime == due
 
     def test_update_reminder_datetime(self, fresh_reminder_manager):
-        due = datetime.now() + timedelta(hours=1)
-        new_due = datetime.now() + timedelta(hours=2)
+        now = datetime.now()
+        due = now + timedelta(hours=1)
+        new_due = now + timedelta(hours=2)
         reminder = fresh_reminder_manager.create_reminder("Test", due)
 
         updated = fresh_reminder_manager.update_reminder(reminder.id, due_datetime=new_due)
         assert updated is not None
         assert updated.due_datetime == new_due
 
+    def test_update_reminder_without_changes_returns_current(self, fresh_reminder_manager):
+        due = datetime.now() + timedelta(hours=1)
+        reminder = fresh_reminder_manager.create_reminder("Unchanged", due)
+
+        assert fresh_reminder_manager.update_reminder(reminder.id) == reminder
+
     def test_update_reminder_not_found(self, fresh_reminder_manager):
         assert fresh_reminder_manager.update_reminder(9999, message="Test") is None
 
@@ -173,8 +224,9 @@ class TestReminderManager:
         assert cleared.status == ReminderStatus.CLEARED
 
     def test_snooze_reminder(self, fresh_reminder_manager):
-        due = datetime.now() + timedelta(hours=1)
-        new_due = datetime.now() + timedelta(hours=2)
+        now = datetime.now()
+        due = now + timedelta(hours=1)
+        new_due = now + timedelta(hours=2)
         reminder = fresh_reminder_manager.create_reminder("Test", due)
 
         # First mark as delivered (simulating it was triggered)
@@ -200,13 +252,12 @@ class TestReminderManager:
 
     def test_get_next_pending_time_multiple(self, fresh_reminder_manager):
         """Returns the earliest due time among multiple reminders."""
-        due1 = datetime.now() + timedelta(hours=2)
-        due2 = datetime.now() + timedelta(hours=1)  # Earlier
-        due3 = datetime.now() + timedelta(hours=3)
+        now = datetime.now()
+        due1 = now + timedelta(hours=2)
+        due2 = now + timedelta(hours=1)  # Earlier
+        due3 = now + timedelta(hours=3)
 
-        fresh_reminder_manager.create_reminder("Later", due1)
-        fresh_reminder_manager.create_reminder("Earliest", due2)
-        fresh_reminder_manager.create_reminder("Latest", due3)
+        fresh_reminder_manager.create_reminders([("Later", due1), ("Earliest", due2), ("Latest", due3)])
 
         next_time = fresh_reminder_manager.get_next_pending_time()
         assert next_time is not None
@@ -214,8 +265,9 @@ class TestReminderManager:
 
     def test_get_next_pending_time_ignores_cleared(self, fresh_reminder_manager):
         """Cleared reminders are not considered."""
-        due1 = datetime.now() + timedelta(hours=1)
-        due2 = datetime.now() + timedelta(hours=2)
+        now = datetime.now()
+        due1 = now + timedelta(hours=1)
+        due2 = now + timedelta(hours=2)
 
         r1 = fresh_reminder_manager.create_reminder("Will be cleared", due1)
         fresh_reminder_manager.create_reminder("Still pending", due2)
@@ -225,27 +277,75 @@ class TestReminderManager:
         assert next_time is not None
         assert next_time == due2
 
+    def test_get_next_pending_time_after_reschedule_and_delete(self, fresh_reminder_manager):
+        """Rescheduled and deleted reminders are reflected in the next pending time."""
+        now = datetime.now()
+        due1 = now + timedelta(hours=1)
+        due2 = now + timedelta(hours=2)
+        later = now + timedelta(hours=3)
+
+        r1 = fresh_reminder_manager.create_reminder("First", due1)
+        r2 = fresh_reminder_manager.create_reminder("Second", due2)
+
+        fresh_reminder_manager.update_reminder(r1.id, due_datetime=later)
+        assert fresh_reminder_manager.get_next_pending_time() == due2
+
+        fresh_reminder_manager.delete_reminder(r2.id)
+        assert fresh_reminder_manager.get_next_pending_time() == later
+
+    def test_pending_queries_use_status_due_index(self, tmp_path):
+        db_path = tmp_path / "test_reminders.db"
+        ReminderManager(db_path=db_path).close()
+
+        conn = sqlite3.connect(db_path)
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM reminders WHERE status = ? AND due_datetime <= ? ORDER BY due_datetime",
+            ("pending", datetime.now().isoformat()),
+        ).fetchall()
+        conn.close()
+
+        assert any("idx_reminders_status_due" in row[-1] for row in plan)
+
+    def test_get_next_pending_time_loaded_from_existing_db(self, tmp_path):
+        """A new manager picks up pending reminders already stored in the database."""
+        db_path = tmp_path / "test_reminders.db"
+        due = datetime.now() + timedelta(hours=1)
+        writer = ReminderManager(db_path=db_path)
+        writer.create_reminder("Persisted", due)
+        writer.close()
+
+        reader = ReminderManager(db_path=db_path)
+        try:
+            assert reader.get_next_pending_time() == due
+        finally:
+            reader.close()
+
 
 class TestReminderManagerEvents:
     """Tests for ReminderManager event emission."""
 
-    @pytest.fixture
-    def manager_with_events(self, tmp_path):
-        """Create a ReminderManager with an event bus."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def event_bus_and_log(cls):
+        """One event bus per class, subscribed once to record schedule changes."""
         from core.events import EventBus, ReminderScheduleChanged
 
         event_bus = EventBus()
         events_received = []
+        event_bus.subscribe(ReminderScheduleChanged, events_received.append)
+        return event_bus, events_received
 
-        def handler(event):
-            events_received.append(event)
+    @pytest.fixture
+    def manager_with_events(self, event_bus_and_log):
+        """Create a ReminderManager on the shared bus with an emptied event log."""
+        event_bus, events_received = event_bus_and_log
+        events_received.clear()
 
-        event_bus.subscribe(ReminderScheduleChanged, handler)
+        manager = ReminderManager(db_path=":memory:", event_bus=event_bus)
 
-        db_path = tmp_path / "test_reminders.db"
-        manager = ReminderManager(db_path=db_path, event_bus=event_bus)
+        yield manager, events_received
 
-        return manager, events_received
+        manager.close()
 
     def test_create_reminder_emits_event(self, manager_with_events):
         manager, events = manager_with_events
@@ -255,10 +355,19 @@ class TestReminderManagerEvents:
 
         assert len(events) == 1
 
-    def test_update_due_datetime_emits_event(self, manager_with_events):
+    def test_create_reminders_emits_one_event(self, manager_with_events):
         manager, events = manager_with_events
         due = datetime.now() + timedelta(hours=1)
-        new_due = datetime.now() + timedelta(hours=2)
+
+        manager.create_reminders([("First", due), ("Second", due), ("Third", due)])
+
+        assert len(events) == 1
+
+    def test_update_due_datetime_emits_event(self, manager_with_events):
+        manager, events = manager_with_events
+        now = datetime.now()
+        due = now + timedelta(hours=1)
+        new_due = now + timedelta(hours=2)
 
         reminder = manager.create_reminder("Test", due)
         events.clear()
@@ -292,8 +401,9 @@ class TestReminderManagerEvents:
 
     def test_snooze_reminder_emits_event(self, manager_with_events):
         manager, events = manager_with_events
-        due = datetime.now() + timedelta(hours=1)
-        new_due = datetime.now() + timedelta(hours=2)
+        now = datetime.now()
+        due = now + timedelta(hours=1)
+        new_due = now + timedelta(hours=2)
 
         reminder = manager.create_reminder("Test", due)
         events.clear()
@@ -302,17 +412,60 @@ class TestReminderManagerEvents:
 
         assert len(events) == 1
 
+    def test_schedule_listener_called_on_change(self, manager_with_events):
+        manager, events = manager_with_events
+
+        class Listener:
+            calls = 0
+
+            def notify(self):
+                self.calls += 1
+
+        listener = Listener()
+        manager.register_schedule_listener(listener.notify)
+
+        manager.create_reminder("Test", datetime.now() + timedelta(hours=1))
+
+        assert listener.calls == 1
+        assert len(events) == 1
+
+    def test_unregistered_schedule_listener_not_called(self, manager_with_events):
+        manager, _ = manager_with_events
+
+        class Listener:
+            calls = 0
+
+            def notify(self):
+                self.calls += 1
+
+        listener = Listener()
+        manager.register_schedule_listener(listener.notify)
+        manager.unregister_schedule_listener(listener.notify)
+
+        manager.create_reminder("Test", datetime.now() + timedelta(hours=1))
+
+        assert listener.calls == 0
+
 
 class TestReminderTools:
     """Tests for the tool functions."""
 
-    @pytest.fixture
-    def reminder_tools(self, tmp_path):
-        """Create reminder tools with a fresh manager."""
-        db_path = tmp_path / "test_reminders.db"
-        manager = ReminderManager(db_path=db_path)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def reminder_tools(cls):
+        """Create reminder tools once per class; building the LangChain tools dominates setup."""
+        manager = ReminderManager(db_path=":memory:")
         create_reminder, list_reminders, update_reminder, delete_reminder = create_reminder_tools(manager)
-        return manager, create_reminder, list_reminders, update_reminder, delete_reminder
+        yield manager, create_reminder, list_reminders, update_reminder, delete_reminder
+        manager.close()
+
+    @pytest.fixture(autouse=True)
+    def _empty_manager(self, reminder_tools):
+        """Delete whatever a test created so the shared manager starts each test empty."""
+        yield
+        manager = reminder_tools[0]
+        for reminder in manager.list_reminders():
+            manager.delete_reminder(reminder.id)
 
     def test_create_reminder_tool(self, reminder_tools):
         _, create_reminder, _, _, _ = reminder_tools
@@ -333,7 +486,7 @@ class TestReminderTools:
     def test_create_reminder_tool_past_time(self, reminder_tools):
         _, create_reminder, _, _, _ = reminder_tools
         past = datetime.now() - timedelta(days=1)
-        datetime_str = past.strftime("%Y-%m-%d at 10am")
+        datetime_str = past.isoformat(timespec="minutes")
 
         result = create_reminder.invoke({"message": "Test", "datetime_str": datetime_str})
         assert "in the past" in result
@@ -0,0 +1,67 @@
+"""Tests for ReminderScheduler timer-driven delivery."""
+
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from agent.tools.reminder import ReminderManager
+from rex.reminder_scheduler import ReminderScheduler
+from rex.settings import ReminderSettings
+
+
+class TestReminderScheduler:
+    """Tests for ReminderScheduler class."""
+
+    @pytest.fixture
+    def scheduler_setup(self, tmp_path):
+        """Create a scheduler wired to a fresh ReminderManager."""
+        manager = ReminderManager(db_path=tmp_path / "test_reminders.db")
+        deliveries = []
+        delivered = threading.Event()
+
+        def on_reminder_due(delivery):
+            deliveries.append(delivery)
+            delivered.set()
+
+        scheduler = ReminderScheduler(manager, ReminderSettings(), on_reminder_due=on_reminder_due)
+
+        yield manager, scheduler, deliveries, delivered
+
+        scheduler.close()
+        manager.close()
+
+    def test_delivers_already_due_reminder_on_start(self, scheduler_setup):
+        manager, scheduler, deliveries, _ = scheduler_setup
+        reminder = manager.create_reminder("Past due", datetime.now() - timedelta(minutes=1))
+
+        scheduler.start()
+
+        assert len(deliveries) == 1
+        assert deliveries[0].reminder.id == reminder.id
+
+    def test_delivers_reminder_when_it_comes_due(self, scheduler_setup):
+        manager, scheduler, deliveries, delivered = scheduler_setup
+        scheduler.start()
+
+        reminder = manager.create_reminder("Soon", datetime.now() + timedelta(seconds=0.2))
+
+        assert delivered.wait(timeout=2.0)
+        assert deliveries[0].reminder.id == reminder.id
+
+    def test_no_timer_without_pending_reminders(self, scheduler_setup):
+        _, scheduler, deliveries, _ = scheduler_setup
+        scheduler.start()
+
+        assert scheduler._timer is None
+        assert deliveries == []
+
+    def test_stop_cancels_timer(self, scheduler_setup):
+        manager, scheduler, deliveries, _ = scheduler_setup
+        scheduler.start()
+        manager.create_reminder("Later", datetime.now() + timedelta(hours=1))
+        assert scheduler._timer is not None
+
+        scheduler.stop()
+
+        assert scheduler._timer is None
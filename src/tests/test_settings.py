@@ -25,3 +25,36 @@ model = "local-model"
 
     assert settings.llm.api_base == "http://example.test:4321/v1"
     assert settings.llm.model == "local-model"
+
+
+def test_stt_settings_default_to_auto(tmp_path):
+    settings = load_settings(tmp_path / "missing-settings.toml")
+
+    assert settings.stt.model == "base.en"
+    assert settings.stt.device == "auto"
+    assert settings.stt.compute_type == "auto"
+    assert settings.stt.beam_size == 1
+    assert settings.stt.silence_threshold == 500
+
+
+def test_stt_settings_can_be_overridden(tmp_path):
+    settings_path = tmp_path / "settings.toml"
+    settings_path.write_text(
+        """
+[stt]
+model = "small"
+device = "cpu"
+compute_type = "int8"
+beam_size = 5
+silence_threshold = 0
+""",
+        encoding="utf-8",
+    )
+
+    settings = load_settings(settings_path)
+
+    assert settings.stt.model == "small"
+    assert settings.stt.device == "cpu"
+    assert settings.stt.compute_type == "int8"
+    assert settings.stt.beam_size == 5
+    assert settings.stt.silence_threshold == 0
@@ -1,5 +1,9 @@
 """Tests for speech-to-text wake word stripping."""
 
+import threading
+from types import SimpleNamespace
+
+import numpy as np
 import pytest
 
 from stt.stt import Transcriber
@@ -10,13 +14,8 @@ class TestStripWakeWord:
 
     @pytest.fixture
     def strip_wake_word(self):
-        """Get the _strip_wake_word method without instantiating the full Transcriber.
-
-        We access the method directly to avoid loading the Whisper model.
-        """
-        # Create a minimal instance without calling __init__
-        transcriber = object.__new__(Transcriber)
-        return transcriber._strip_wake_word
+        """Get the _strip_wake_word staticmethod; no Transcriber (or Whisper model) is needed."""
+        return Transcriber._strip_wake_word
 
     def test_hey_rex_at_start(self, strip_wake_word):
         """Test stripping 'hey rex' from the start."""
@@ -74,3 +73,99 @@ class TestStripWakeWord:
         """Test that the rest of the text is preserved exactly."""
         result = strip_wake_word("hey rex Set a Timer for 5 Minutes Please")
         assert result == "Set a Timer for 5 Minutes Please"
+
+
+class TestIterTranscribe:
+    """Tests for Transcriber.iter_transcribe segment streaming."""
+
+    @pytest.fixture
+    def make_transcriber(self):
+        """Build a Transcriber around a fake model that emits the given segment texts."""
+
+        def _make(texts):
+            model = SimpleNamespace(
+                transcribe=lambda *args, **kwargs: ((SimpleNamespace(text=t) for t in texts), None)
+            )
+            transcriber = object.__new__(Transcriber)
+            transcriber._model = model
+            transcriber._beam_size = 1
+            transcriber._silence_threshold = 0
+            transcriber._load_error = None
+            transcriber._ready = threading.Event()
+            transcriber._ready.set()
+            transcriber._scratch = np.empty(4, dtype=np.float32)
+            return transcriber
+
+        return _make
+
+    def test_yields_each_segment(self, make_transcriber):
+        """Test segments are yielded individually and stripped."""
+        transcriber = make_transcriber([" Set a timer", " for five minutes."])
+        audio = np.zeros(16000, dtype=np.int16)
+        assert list(transcriber.iter_transcribe(audio)) == ["Set a timer", "for five minutes."]
+
+    def test_strips_wake_word_from_first_speech_segment_only(self, make_transcriber):
+        """Test the wake word is removed once, skipping segments left empty."""
+        transcriber = make_transcriber([" Hey Rex.", " what time", " hey rex"])
+        audio = np.zeros(16000, dtype=np.int16)
+        assert list(transcriber.iter_transcribe(audio)) == ["What time", "hey rex"]
+
+    def test_transcribe_joins_segments(self, make_transcriber):
+        """Test transcribe returns the streamed segments joined with spaces."""
+        transcriber = make_transcriber([" Hey rex, what's", " the weather?"])
+        audio = np.zeros(16000, dtype=np.int16)
+        assert transcriber.transcribe(audio) == "What's the weather?"
+
+    def test_scratch_buffer_grows_and_is_reused(self, make_transcriber):
+        """Test int16 input is scaled into a grow-only reused float32 buffer."""
+        transcriber = make_transcriber([])
+        received = []
+        transcriber._model = SimpleNamespace(
+            transcribe=lambda audio, **kwargs: (received.append(audio) or iter(()), None)
+        )
+
+        transcriber.transcribe(np.full(8, 16384, dtype=np.int16))
+        grown = transcriber._scratch
+        assert grown.size == 8
+        np.testing.assert_array_equal(received[0], np.full(8, 0.5, dtype=np.float32))
+
+        transcriber.transcribe(np.full(3, -32768, dtype=np.int16))
+        assert transcriber._scratch is grown
+        np.testing.assert_array_equal(received[1], np.full(3, -1.0, dtype=np.float32))
+
+    def test_vad_filter_off_unless_requested(self, make_transcriber):
+        """Test Whisper's VAD only runs when the caller asks for it."""
+        transcriber = make_transcriber([])
+        calls = []
+        transcriber._model = SimpleNamespace(
+            transcribe=lambda audio, **kwargs: (calls.append(kwargs) or iter(()), None)
+        )
+        audio = np.zeros(16000, dtype=np.int16)
+
+        transcriber.transcribe(audio)
+        transcriber.transcribe(audio, vad_filter=True)
+
+        assert [call["vad_filter"] for call in calls] == [False, True]
+
+    def test_silent_audio_skips_the_model(self, make_transcriber):
+        """Test clips below the noise floor never reach Whisper."""
+        transcriber = make_transcriber(["Loud enough"])
+        transcriber._silence_threshold = 500
+
+        assert transcriber.transcribe(np.full(16000, -499, dtype=np.int16)) == ""
+        assert transcriber.transcribe(np.full(16000, 0.01, dtype=np.float32)) == ""
+        assert transcriber.transcribe(np.full(16000, -32768, dtype=np.int16)) == "Loud enough"
+
+    def test_empty_audio_yields_nothing(self, make_transcriber):
+        """Test empty input produces no segments."""
+        transcriber = make_transcriber(["unused"])
+        assert list(transcriber.iter_transcribe(np.array([], dtype=np.int16))) == []
+
+    def test_wait_until_ready_raises_load_error(self, make_transcriber):
+        """Test a failed background load surfaces from wait_until_ready."""
+        transcriber = make_transcriber([])
+        transcriber._load_error = OSError("model not found")
+
+        with pytest.raises(RuntimeError) as excinfo:
+            transcriber.wait_until_ready()
+        assert isinstance(excinfo.value.__cause__, OSError)
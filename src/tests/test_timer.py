@@ -2,6 +2,7 @@
 
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 from agent.tools.timer import (
@@ -109,17 +110,13 @@ class TestTimerManager:
     @pytest.fixture
     def fresh_timer_manager(self):
         """Create a fresh TimerManager instance for testing."""
-        # Mock sound file loading to avoid file dependencies
-        with patch("agent.tools.timer.sf.read") as mock_read:
-            mock_read.return_value = (MagicMock(), 44100)
-            manager = TimerManager()
-            # Disable sound playback in tests
-            manager._sound_data = None
+        # No audio manager, so the alarm sound is never loaded or played
+        manager = TimerManager()
 
-            yield manager
+        yield manager
 
-            # Clean up timers
-            manager.cleanup()
+        # Clean up timers
+        manager.cleanup()
 
     def test_set_timer_returns_confirmation(self, fresh_timer_manager):
         result = fresh_timer_manager.set_timer("test", 60.0)
@@ -176,3 +173,21 @@ class TestTimerManager:
 
         fresh_timer_manager.unmute()
         assert fresh_timer_manager._muted is False
+
+    def test_alarm_sound_decoded_once_on_first_ring(self, tmp_path):
+        sound_path = tmp_path / "alarm.mp3"
+        sound_path.touch()
+        audio_manager = MagicMock()
+
+        with patch("agent.tools.timer.sf.read") as mock_read:
+            mock_read.return_value = (np.zeros((4, 2)), 44100)
+            manager = TimerManager(audio_manager=audio_manager, sound_path=sound_path)
+            assert mock_read.call_count == 0
+
+            manager._start_alarm_sound()
+            manager._start_alarm_sound()
+
+        assert mock_read.call_count == 1
+        sound, sample_rate = audio_manager.start_loop.call_args[0]
+        assert sound.shape == (4,)
+        assert sample_rate == 44100
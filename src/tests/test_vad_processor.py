@@ -1,28 +1,52 @@
 """Tests for VADProcessor class."""
 
-from unittest.mock import MagicMock
-
 import numpy as np
 import pytest
 
 from wake_word.wake_word_listener import VADProcessor
 
 
+class _Probability:
+    """Stands in for the 0-d tensor the Silero model returns."""
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: float):
+        self._value = value
+
+    def item(self) -> float:
+        return self._value
+
+
+class FakeVAD:
+    """Callable VAD model that records its calls and returns scripted probabilities."""
+
+    def __init__(self, probability: float = 0.5):
+        self.probability = probability
+        self.queued: list[float] = []
+        self.calls: list[tuple] = []
+        self.state_resets = 0
+
+    def __call__(self, audio, sample_rate):
+        self.calls.append((audio, sample_rate))
+        return _Probability(self.queued.pop(0) if self.queued else self.probability)
+
+    def reset_states(self):
+        self.state_resets += 1
+
+
 class TestVADProcessor:
     """Tests for VADProcessor class."""
 
     @pytest.fixture
-    def mock_vad_model(self):
-        """Create a mock VAD model that returns configurable speech probabilities."""
-        model = MagicMock()
-        # Default to returning 0.5 probability
-        model.return_value.item.return_value = 0.5
-        return model
+    def fake_vad_model(self):
+        """Create a fake VAD model that returns configurable speech probabilities."""
+        return FakeVAD()
 
     @pytest.fixture
-    def vad_processor(self, mock_vad_model):
-        """Create a VADProcessor with mock model."""
-        return VADProcessor(mock_vad_model, sample_rate=16000, chunk_size=512)
+    def vad_processor(self, fake_vad_model):
+        """Create a VADProcessor with a fake model."""
+        return VADProcessor(fake_vad_model, sample_rate=16000, chunk_size=512)
 
     def test_add_audio_stores_in_buffer(self, vad_processor):
         """Test that add_audio stores chunks in the buffer."""
@@ -30,18 +54,19 @@ class TestVADProcessor:
 
         vad_processor.add_audio(chunk)
 
-        assert len(vad_processor._buffer) == 1
-        assert np.array_equal(vad_processor._buffer[0], chunk)
+        assert len(vad_processor) == 256
 
-    def test_add_multiple_chunks(self, vad_processor):
-        """Test adding multiple audio chunks."""
+    def test_add_multiple_chunks(self, vad_processor, fake_vad_model):
+        """Test chunks added separately reach the model as one contiguous window."""
         chunk1 = np.zeros(256, dtype=np.float32)
         chunk2 = np.ones(256, dtype=np.float32)
 
         vad_processor.add_audio(chunk1)
         vad_processor.add_audio(chunk2)
+        vad_processor.process()
 
-        assert len(vad_processor._buffer) == 2
+        window, _ = fake_vad_model.calls[0]
+        assert np.array_equal(np.asarray(window), np.concatenate([chunk1, chunk2]))
 
     def test_process_returns_empty_when_insufficient_samples(self, vad_processor):
         """Test process returns empty list when not enough samples for a chunk."""
@@ -53,9 +78,9 @@ class TestVADProcessor:
 
         assert result == []
 
-    def test_process_returns_probability_when_enough_samples(self, vad_processor, mock_vad_model):
+    def test_process_returns_probability_when_enough_samples(self, vad_processor, fake_vad_model):
         """Test process returns speech probability when enough samples."""
-        mock_vad_model.return_value.item.return_value = 0.8
+        fake_vad_model.probability = 0.8
 
         # Add exactly chunk_size (512) samples
         chunk = np.zeros(512, dtype=np.float32)
@@ -66,10 +91,10 @@ class TestVADProcessor:
         assert len(result) == 1
         assert result[0] == 0.8
 
-    def test_process_handles_multiple_chunks_worth_of_audio(self, vad_processor, mock_vad_model):
+    def test_process_handles_multiple_chunks_worth_of_audio(self, vad_processor, fake_vad_model):
         """Test processing multiple chunks worth of audio."""
         # Configure model to return different values on successive calls
-        mock_vad_model.return_value.item.side_effect = [0.3, 0.7, 0.9]
+        fake_vad_model.queued = [0.3, 0.7, 0.9]
 
         # Add enough for 3 VAD chunks (512 * 3 = 1536 samples)
         chunk = np.zeros(1536, dtype=np.float32)
@@ -80,9 +105,9 @@ class TestVADProcessor:
         assert len(result) == 3
         assert result == [0.3, 0.7, 0.9]
 
-    def test_process_keeps_remainder_in_buffer(self, vad_processor, mock_vad_model):
+    def test_process_keeps_remainder_in_buffer(self, vad_processor, fake_vad_model):
         """Test that remaining samples stay in buffer after processing."""
-        mock_vad_model.return_value.item.return_value = 0.5
+        fake_vad_model.probability = 0.5
 
         # Add 700 samples (512 + 188 remaining)
         chunk = np.zeros(700, dtype=np.float32)
@@ -91,8 +116,7 @@ class TestVADProcessor:
         vad_processor.process()
 
         # Should have 188 samples remaining
-        total_remaining = sum(len(c) for c in vad_processor._buffer)
-        assert total_remaining == 188
+        assert len(vad_processor) == 188
 
     def test_reset_clears_buffer(self, vad_processor):
         """Test reset clears the audio buffer."""
@@ -102,11 +126,17 @@ class TestVADProcessor:
 
         vad_processor.reset()
 
-        assert len(vad_processor._buffer) == 0
+        assert len(vad_processor) == 0
+
+    def test_reset_clears_model_state(self, vad_processor, fake_vad_model):
+        """Test reset also clears the model's recurrent state."""
+        vad_processor.reset()
+
+        assert fake_vad_model.state_resets == 1
 
-    def test_process_after_reset(self, vad_processor, mock_vad_model):
+    def test_process_after_reset(self, vad_processor, fake_vad_model):
         """Test processing works correctly after reset."""
-        mock_vad_model.return_value.item.return_value = 0.6
+        fake_vad_model.probability = 0.6
 
         # Add and process some audio
         chunk1 = np.zeros(512, dtype=np.float32)
@@ -123,9 +153,9 @@ class TestVADProcessor:
 
         assert len(result) == 1
 
-    def test_incremental_processing(self, vad_processor, mock_vad_model):
+    def test_incremental_processing(self, vad_processor, fake_vad_model):
         """Test incremental addition and processing of audio."""
-        mock_vad_model.return_value.item.return_value = 0.5
+        fake_vad_model.probability = 0.5
 
         # Add in small increments
         for _ in range(4):
@@ -137,9 +167,9 @@ class TestVADProcessor:
 
         assert len(result) == 1
 
-    def test_model_receives_correct_audio_format(self, mock_vad_model):
+    def test_model_receives_correct_audio_format(self, fake_vad_model):
         """Test that the VAD model receives audio in the correct format."""
-        processor = VADProcessor(mock_vad_model, sample_rate=16000, chunk_size=512)
+        processor = VADProcessor(fake_vad_model, sample_rate=16000, chunk_size=512)
 
         # Add audio as float32
         chunk = np.random.randn(512).astype(np.float32)
@@ -147,13 +177,25 @@ class TestVADProcessor:
 
         processor.process()
 
-        # Check that model was called
-        mock_vad_model.assert_called_once()
-
-        # Get the tensor that was passed to the model
-        call_args = mock_vad_model.call_args
-        audio_tensor = call_args[0][0]
-        sample_rate = call_args[0][1]
+        # Check that model was called once, with the tensor and sample rate
+        assert len(fake_vad_model.calls) == 1
+        audio_tensor, sample_rate = fake_vad_model.calls[0]
 
         assert sample_rate == 16000
         assert len(audio_tensor) == 512
+
+    def test_buffer_preserves_order_across_wraparound(self, vad_processor, fake_vad_model):
+        """Test samples reach the model in order after the ring wraps and grows."""
+        samples = np.arange(12000, dtype=np.float32)
+
+        vad_processor.add_audio(samples[:3000])
+        assert len(vad_processor.process()) == 5
+
+        # Wraps past the end of the ring, then forces it to grow
+        vad_processor.add_audio(samples[3000:5000])
+        vad_processor.add_audio(samples[5000:])
+        assert len(vad_processor.process()) == 18
+
+        windows = np.concatenate([np.asarray(window) for window, _ in fake_vad_model.calls[5:]])
+        assert np.array_equal(windows, samples[2560 : 2560 + 18 * 512])
+        assert len(vad_processor) == 224
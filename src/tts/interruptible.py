@@ -27,6 +27,11 @@ class InterruptibleSpeaker:
     Uses WakeWordMonitor to detect when the user says "Hey Rex" during playback.
     When interrupted, captures the user's speech including any words spoken
     after the wake word.
+
+    The monitor's thread is started once and paused between utterances; it
+    only reads from the input stream it shares with WakeWordListener while
+    speaking. Use the speaker as a context
+    manager, or call close(), to stop the thread.
     """
 
     def __init__(
@@ -48,6 +53,7 @@ class InterruptibleSpeaker:
         self.voice = voice
         self._audio_manager = audio_manager
         self._monitor = WakeWordMonitor(model_path, threshold=threshold)
+        self._is_open = False
 
     def speak_interruptibly(self, text: str) -> tuple[bool, np.ndarray | None]:
         """
@@ -65,9 +71,12 @@ class InterruptibleSpeaker:
             - was_interrupted: True if speech was interrupted by wake word
             - captured_audio: numpy array of captured audio if interrupted, else None
         """
-        self._monitor.start()
-        if not self._monitor.wait_until_ready(timeout=1.0):
-            print("⚠️ Wake word monitor failed to start")
+        if not self.open():
+            # Still speak, just without the wake word check
+            speak_text(text, self.voice, self._audio_manager)
+            return False, None
+
+        self._monitor.resume()
 
         try:
             was_interrupted = speak_text(
@@ -79,7 +88,7 @@ class InterruptibleSpeaker:
                 self._audio_manager.play_listening_tone()
 
                 # Wait a moment for the monitor to finish capturing audio
-                self._monitor.stop()
+                self._monitor.pause()
 
                 # Play done tone to indicate we've captured their speech
                 self._audio_manager.play_done_tone()
@@ -88,5 +97,41 @@ class InterruptibleSpeaker:
 
             return False, None
         finally:
-            # Always stop monitoring when done
-            self._monitor.stop()
+            # Always stop listening when done, handing the input stream back
+            self._monitor.pause()
+
+    def open(self) -> bool:
+        """
+        Start the wake word monitor if it isn't already running.
+
+        Restarts the monitor if its thread has exited since; a device error
+        only ends the current utterance's session, not the thread.
+
+        Returns:
+            True if the monitor is running and ready to detect the wake word.
+        """
+        if self._is_open:
+            if self._monitor.is_running():
+                return True
+            print("⚠️ Wake word monitor stopped; restarting it")
+            self._is_open = False
+
+        self._monitor.start()
+        if not self._monitor.wait_until_ready(timeout=1.0) or not self._monitor.is_running():
+            print("⚠️ Wake word monitor failed to start")
+            return False
+        self._is_open = True
+        return True
+
+    def close(self) -> None:
+        """Stop the wake word monitor."""
+        # Stopped even if open() never saw it become ready, as the thread may still be starting
+        self._monitor.stop()
+        self._is_open = False
+
+    def __enter__(self) -> InterruptibleSpeaker:
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -10,15 +10,17 @@ import warnings
 from collections.abc import Callable
 from typing import TYPE_CHECKING
 
-import torch
-from kokoro import KPipeline
-
 if TYPE_CHECKING:
     from audio.manager import AudioManager
 
 
 class KokoroVoice:
-    def __init__(self, lang_code, voice):
+    def __init__(self, lang_code, voice, warmup=True):
+        # Imported here so importing the tts package doesn't load Kokoro and its
+        # model dependencies until a voice is actually constructed
+        import torch
+        from kokoro import KPipeline
+
         self.voice = voice
         with warnings.catch_warnings():
             warnings.filterwarnings("ignore", category=UserWarning, module="torch")
@@ -26,6 +28,11 @@ class KokoroVoice:
             self.pipeline = KPipeline(lang_code=lang_code, repo_id="hexgrad/Kokoro-82M")
             if torch.backends.mps.is_available():
                 self.pipeline.model = self.pipeline.model.to("mps")
+            if warmup:
+                # The first synthesis loads the voice pack and initializes the
+                # model's kernels; pay for that here rather than on the first reply
+                for _ in self.pipeline("ok", voice=self.voice):
+                    pass
         self.sample_rate = 24000
 
     def synthesize(self, text):
@@ -47,7 +54,9 @@ def speak_text(
     """
     Speak text using TTS, with optional interruption support.
 
-    Routes audio through AudioManager for coordinated playback.
+    Routes audio through AudioManager for coordinated playback. Each chunk is
+    queued as soon as it is synthesized, so Kokoro works on the next sentence
+    while the previous one plays instead of leaving a gap between them.
 
     Args:
         text: Text to speak
@@ -63,10 +72,6 @@ def speak_text(
             audio_manager.stop_current()
             return True
 
-        was_interrupted = audio_manager.queue_audio_blocking(
-            chunk, voice_obj.sample_rate, interrupt_check
-        )
-        if was_interrupted:
-            return True
+        audio_manager.queue_audio(chunk, voice_obj.sample_rate)
 
-    return False
+    return audio_manager.wait_until_played(interrupt_check)
@@ -1,3 +1,11 @@
-from .wake_word_listener import WakeWordListener, WakeWordMonitor
-
 __all__ = ["WakeWordListener", "WakeWordMonitor"]
+
+
+def __getattr__(name: str):
+    # Resolved on first use so importing wake_word.cli (e.g. for --help) doesn't
+    # load torch, openWakeWord and Silero VAD before arguments are validated
+    if name in __all__:
+        from . import wake_word_listener
+
+        return getattr(wake_word_listener, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
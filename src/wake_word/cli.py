@@ -2,8 +2,6 @@ import argparse
 import sys
 from pathlib import Path
 
-from .wake_word_listener import WakeWordListener
-
 
 def main():
     parser = argparse.ArgumentParser(description="Wake Word Tester - Test wake word detection")
@@ -26,6 +24,9 @@ def main():
         print("❌ Error: Threshold must be between 0.0 and 1.0")
         sys.exit(1)
 
+    # Imported after validation so --help and bad arguments don't wait on model libraries
+    from .wake_word_listener import WakeWordListener
+
     listener = WakeWordListener(model_path=str(model_path), threshold=args.threshold)
 
     print("\n🎤 Listening for wake word...")
@@ -3,6 +3,10 @@
 import sys
 from pathlib import Path
 
+# Set once the models are known to be present; both the listener and the
+# interruption monitor call ensure_openwakeword_models() at startup
+_models_ready = False
+
 
 def ensure_openwakeword_models() -> bool:
     """
@@ -15,6 +19,10 @@ def ensure_openwakeword_models() -> bool:
     Returns:
         bool: True if models are available, False if download failed
     """
+    global _models_ready
+    if _models_ready:
+        return True
+
     try:
         import openwakeword
 
@@ -38,6 +46,7 @@ def ensure_openwakeword_models() -> bool:
             print("✅ Model download complete!")
             print()
 
+        _models_ready = True
         return True
 
     except Exception as e:
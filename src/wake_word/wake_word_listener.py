@@ -8,10 +8,12 @@ the complete audio (buffered + new) for transcription.
 
 from __future__ import annotations
 
-import collections
+import logging
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -25,6 +27,90 @@ from .model_utils import ensure_openwakeword_models
 if TYPE_CHECKING:
     from audio.manager import AudioManager
 
+log = logging.getLogger(__name__)
+
+# Samples per Silero VAD window at 16 kHz
+_VAD_WINDOW = 512
+
+
+@lru_cache(maxsize=None)
+def _load_models(model_path: str, chunk_size: int, sample_rate: int) -> tuple[Model, object]:
+    """
+    Load the wake word and VAD models once per model path and share them.
+
+    WakeWordListener and WakeWordMonitor are driven by the same state machine
+    and never run inference at the same time: the listener only reads audio
+    while waiting or listening, the monitor only between resume() and pause(),
+    and pause() doesn't return until the monitor thread has stopped using the
+    models. Each resets the wake word model before it starts detecting, so
+    sharing one pair halves load time and memory without carrying state across.
+
+    ONNX Runtime does much of its setup on the first inference, so one silent
+    frame is run through both here, keeping that out of the first live frame.
+    """
+    wake_model = Model(wakeword_models=[model_path], inference_framework="onnx")
+    # The ONNX build runs on ONNX Runtime, already loaded for openWakeWord, and
+    # avoids TorchScript's per-call dispatch on every 32 ms window
+    vad_model = load_silero_vad(onnx=True)
+
+    wake_model.predict(np.zeros(chunk_size, dtype=np.int16))
+    wake_model.reset()
+    vad_model(torch.zeros(_VAD_WINDOW), sample_rate)
+    vad_model.reset_states()
+
+    return wake_model, vad_model
+
+
+# The one capture stream in the process. Exclusive devices (e.g. ALSA hw:)
+# allow only a single open stream, so WakeWordListener and WakeWordMonitor
+# take turns on this one, never at the same time, instead of each opening
+# their own. It is kept open between sessions so they don't pay PortAudio's
+# open cost, and only closed by WakeWordListener.stop()
+_input_stream: sd.InputStream | None = None
+_input_stream_lock = threading.Lock()
+
+
+@contextmanager
+def _streaming(sample_rate: int, chunk_size: int) -> Iterator[sd.InputStream]:
+    """Start the shared input stream for one session, opening the device on first use."""
+    global _input_stream
+    with _input_stream_lock:
+        if _input_stream is None or _input_stream.closed:
+            _input_stream = sd.InputStream(
+                samplerate=sample_rate,
+                channels=1,
+                dtype=np.int16,
+                blocksize=chunk_size,
+            )
+        stream = _input_stream
+
+    stream.start()
+    try:
+        yield stream
+    finally:
+        # Stopped, not closed; stopping also drops any input buffered since
+        if not stream.closed:
+            stream.stop()
+
+
+def _close_input_stream():
+    """Close the shared input stream, releasing the device."""
+    global _input_stream
+    with _input_stream_lock:
+        if _input_stream is not None:
+            _input_stream.close()
+            _input_stream = None
+
+
+def _silence_windows(silence_duration: float, sample_rate: int) -> int:
+    """
+    Number of consecutive non-speech VAD windows that still count as a pause.
+
+    Silence is measured in audio rather than wall-clock time, so one window
+    past this count means silence_duration has elapsed.
+    """
+    return int(silence_duration * sample_rate) // _VAD_WINDOW
+
 
 class WakeWordMonitor:
     """
@@ -61,20 +147,27 @@ class WakeWordMonitor:
         if not ensure_openwakeword_models():
             raise RuntimeError("Failed to download required models")
 
-        # Load wake word model (separate instance for this monitor)
-        self._wake_model = Model(wakeword_models=[model_path], inference_framework="onnx")
-
-        # Load VAD model for end-of-speech detection
-        self._vad_model = load_silero_vad()
+        # Wake word model, plus VAD model for end-of-speech detection
+        self._wake_model, self._vad_model = _load_models(model_path, self.chunk_size, self.sample_rate)
+        # Only one wake word model is loaded, so its score is the one prediction key
+        self._wake_key = next(iter(self._wake_model.models))
+        self._vad = VADProcessor(self._vad_model, self.sample_rate)
 
         # Rolling buffer for audio capture
         buffer_samples = int(self.sample_rate * buffer_duration)
-        self._ring_buffer: collections.deque = collections.deque(maxlen=buffer_samples)
+        self._ring_buffer = RollingAudioBuffer(buffer_samples)
 
-        # Threading state
+        # Threading state. The thread lives from start() to stop() and runs one
+        # detection session on the shared input stream per resume(), so it only
+        # uses the device while speaking. _busy is True while a session may be using
+        # the stream or the shared models. It and _active_event change only under
+        # _state_cond, so pause() can wait for the session to end
         self._detected_event = threading.Event()
         self._stop_event = threading.Event()
         self._ready_event = threading.Event()
+        self._active_event = threading.Event()
+        self._state_cond = threading.Condition()
+        self._busy = False
         self._thread: threading.Thread | None = None
 
         # Captured audio after wake word detection
@@ -82,86 +175,136 @@ class WakeWordMonitor:
         self._audio_lock = threading.Lock()
 
     def _monitor_loop(self):
-        """Background thread that listens for wake word and captures audio."""
-        try:
-            stream = sd.InputStream(
-                samplerate=self.sample_rate,
-                channels=1,
-                dtype=np.int16,
-                blocksize=self.chunk_size,
-            )
-            with stream:
-                self._ready_event.set()  # Signal that we're ready to detect
-                self._wake_model.reset()
-                while not self._stop_event.is_set():
-                    audio_chunk, _ = stream.read(self.chunk_size)
-                    audio_chunk = audio_chunk.flatten()
-
-                    # Add to rolling buffer
-                    self._ring_buffer.extend(audio_chunk)
+        """Background thread that runs a detection session each time the monitor is resumed."""
+        self._ready_event.set()  # Signal that we're ready to detect
+        while True:
+            with self._state_cond:
+                self._state_cond.wait_for(lambda: self._active_event.is_set() or self._stop_event.is_set())
+                if self._stop_event.is_set():
+                    return
+                self._busy = True
+            try:
+                self._run_session()
+            except Exception as e:
+                print(f"⚠️ Wake word monitor error: {e}")
+            finally:
+                with self._state_cond:
+                    # Paused, captured, or failed: wait for the next resume() either way
+                    self._active_event.clear()
+                    self._busy = False
+                    self._state_cond.notify_all()
+
+    def _run_session(self):
+        """Listen for the wake word until paused, then capture speech if it was heard."""
+        # Start each session from a clean model and buffer
+        self._wake_model.reset()
+        self._ring_buffer.clear()
 
-                    predictions = self._wake_model.predict(audio_chunk)
-                    for score in predictions.values():
-                        if score >= self.threshold:
-                            self._detected_event.set()
-                            # Continue recording until silence
-                            self._capture_until_silence(stream)
-                            return
-        except Exception as e:
-            print(f"⚠️ Wake word monitor error: {e}")
+        with _streaming(self.sample_rate, self.chunk_size) as stream:
+            while self._active_event.is_set() and not self._stop_event.is_set():
+                audio_chunk, _ = stream.read(self.chunk_size)
+
+                # The mono channel as a view; read() returns a fresh array each call
+                audio_chunk = audio_chunk[:, 0]
+
+                # Add to rolling buffer
+                self._ring_buffer.extend(audio_chunk)
+
+                if self._wake_model.predict(audio_chunk)[self._wake_key] >= self.threshold:
+                    self._detected_event.set()
+                    # Continue recording until silence, then wait for the next resume()
+                    self._capture_until_silence(stream)
+                    return
 
     def _capture_until_silence(self, stream: sd.InputStream):
-        """Continue recording after wake word until VAD detects silence."""
+        """Continue recording after wake word until VAD detects silence or the monitor is paused."""
         # Start with buffered audio
-        audio_chunks = [np.array(self._ring_buffer, dtype=np.int16)]
+        audio = AudioAccumulator()
+        for part in self._ring_buffer.views():
+            audio.append(part)
 
-        last_speech_time = time.time()
         speech_detected = False
-        vad = VADProcessor(self._vad_model, self.sample_rate)
+        silent_windows = 0
+        max_silent_windows = _silence_windows(self.silence_duration, self.sample_rate)
+        vad = self._vad
+        vad.reset()
 
-        while not self._stop_event.is_set():
+        while self._active_event.is_set() and not self._stop_event.is_set():
             try:
                 audio_chunk, _ = stream.read(self.chunk_size)
-                audio_chunk = audio_chunk.flatten()
-                audio_chunks.append(audio_chunk)
+                audio_chunk = audio_chunk[:, 0]
+                audio.append(audio_chunk)
                 vad.add_audio(audio_chunk)
 
                 for speech_prob in vad.process():
                     if speech_prob > 0.5:
                         speech_detected = True
-                        last_speech_time = time.time()
-
-                    # Stop if speech was detected and now silent
-                    if speech_detected and (time.time() - last_speech_time) > self.silence_duration:
-                        with self._audio_lock:
-                            self._captured_audio = np.concatenate(audio_chunks)
-                        return
+                        silent_windows = 0
+                    elif speech_detected:
+                        silent_windows += 1
+                        # Stop once speech has been followed by enough silence
+                        if silent_windows > max_silent_windows:
+                            with self._audio_lock:
+                                self._captured_audio = audio.get()
+                            return
             except Exception:
                 break
 
         # Save whatever we captured
-        if audio_chunks:
-            with self._audio_lock:
-                self._captured_audio = np.concatenate(audio_chunks)
+        with self._audio_lock:
+            self._captured_audio = audio.get()
 
     def start(self):
-        """Start monitoring for wake word in the background."""
-        # Ensure any previous thread is fully stopped
+        """Start the monitor thread, paused until resume()."""
         if self._thread is not None and self._thread.is_alive():
-            self._stop_event.set()
-            self._thread.join(timeout=0.5)
+            return
 
+        self._stop_event.clear()
+        self._ready_event.clear()
+        self._active_event.clear()
+        self._busy = False
         self.reset()
         self._thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self._thread.start()
 
     def stop(self):
-        """Stop monitoring."""
-        self._stop_event.set()
+        """Stop monitoring and end the monitor thread."""
+        with self._state_cond:
+            self._active_event.clear()
+            self._stop_event.set()
+            self._state_cond.notify_all()
         if self._thread is not None:
             self._thread.join(timeout=1.0)  # Longer timeout to allow audio capture to complete
             self._thread = None
 
+    def is_running(self) -> bool:
+        """Check if the monitor thread is alive, i.e. started and not yet stopped."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def resume(self):
+        """Clear the previous detection and start listening for the wake word."""
+        self.reset()
+        with self._state_cond:
+            self._active_event.set()
+            self._state_cond.notify_all()
+
+    def pause(self):
+        """
+        Stop listening for the wake word and hand back the input stream.
+
+        Waits for the monitor thread to finish any inference or capture in
+        progress and stop the shared stream, so the stream and the shared
+        models are free for WakeWordListener once this returns. If the wake word was
+        detected, the captured audio has been saved by then.
+        """
+        with self._state_cond:
+            self._active_event.clear()
+            if not self._state_cond.wait_for(lambda: not self._busy, timeout=1.0):
+                # Still mid-inference (e.g. a stalled read); the models must not be
+                # handed over until it finishes, so keep waiting
+                log.warning("Wake word monitor is slow to pause; waiting for it to go idle")
+                self._state_cond.wait_for(lambda: not self._busy)
+
     def was_detected(self) -> bool:
         """Check if wake word was detected (non-blocking)."""
         return self._detected_event.is_set()
@@ -179,9 +322,6 @@ class WakeWordMonitor:
     def reset(self):
         """Reset the detection state."""
         self._detected_event.clear()
-        self._stop_event.clear()
-        self._ready_event.clear()
-        self._ring_buffer.clear()
         with self._audio_lock:
             self._captured_audio = None
 
@@ -198,40 +338,154 @@ class WakeWordMonitor:
         return self._ready_event.wait(timeout=timeout)
 
 
+class RollingAudioBuffer:
+    """Fixed-size int16 ring that keeps the most recent samples written to it."""
+
+    def __init__(self, capacity: int):
+        self._ring = np.zeros(capacity, dtype=np.int16)
+        self._write = 0  # Running count of samples written; modulo capacity indexes the ring
+        self._size = 0  # Samples currently held, up to capacity
+
+    def __len__(self) -> int:
+        return self._size
+
+    def clear(self):
+        """Drop all held samples."""
+        self._write = self._size = 0
+
+    def extend(self, chunk: np.ndarray):
+        """Write a chunk, overwriting the oldest samples once the ring is full."""
+        capacity = len(self._ring)
+        count = len(chunk)
+        if count > capacity:
+            # Only the tail can survive; skip ahead as if the rest had been written
+            self._write += count - capacity
+            chunk = chunk[-capacity:]
+            count = capacity
+
+        start = self._write % capacity
+        first = min(count, capacity - start)
+        self._ring[start : start + first] = chunk[:first]
+        self._ring[: count - first] = chunk[first:]
+        self._write += count
+        self._size = min(self._size + count, capacity)
+
+    def keep_last(self, count: int):
+        """Drop all but the newest count samples."""
+        self._size = min(self._size, count)
+
+    def views(self) -> tuple[np.ndarray, ...]:
+        """Return the held samples, oldest first, as one or two views into the ring."""
+        capacity = len(self._ring)
+        start = (self._write - self._size) % capacity
+        end = start + self._size
+        if end <= capacity:
+            return (self._ring[start:end],)
+        return (self._ring[start:], self._ring[: end - capacity])
+
+
+class AudioAccumulator:
+    """Growable int16 buffer that capture loops append audio chunks to."""
+
+    def __init__(self, capacity: int = 16000 * 10):
+        self._buffer = np.empty(capacity, dtype=np.int16)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, chunk: np.ndarray):
+        """Copy a chunk onto the end, doubling the buffer when it runs out of room."""
+        end = self._size + len(chunk)
+        if end > len(self._buffer):
+            capacity = len(self._buffer) * 2
+            while capacity < end:
+                capacity *= 2
+            buffer = np.empty(capacity, dtype=np.int16)
+            buffer[: self._size] = self._buffer[: self._size]
+            self._buffer = buffer
+        self._buffer[self._size : end] = chunk
+        self._size = end
+
+    def get(self) -> np.ndarray:
+        """Return the audio appended so far, as a view into the buffer."""
+        return self._buffer[: self._size]
+
+
 class VADProcessor:
     """Processes audio chunks through VAD model to detect speech."""
 
-    def __init__(self, vad_model, sample_rate: int, chunk_size: int = 512):
+    def __init__(self, vad_model, sample_rate: int, chunk_size: int = _VAD_WINDOW):
         self._vad_model = vad_model
         self._sample_rate = sample_rate
         self._chunk_size = chunk_size
-        self._buffer: list[np.ndarray] = []
+
+        # Circular float32 buffer; _read and _write are running sample counts,
+        # taken modulo the capacity to index into it. The capacity stays a
+        # multiple of chunk_size, so a window handed to the model never wraps
+        # and is always a view
+        self._ring = np.empty(chunk_size * 8, dtype=np.float32)
+        self._read = 0
+        self._write = 0
+
+    def __len__(self) -> int:
+        """Number of buffered samples not yet handed to the model."""
+        return self._write - self._read
+
+    def _take(self, position: int, count: int) -> np.ndarray:
+        """Return count samples starting at a running position; a view unless they wrap."""
+        capacity = len(self._ring)
+        start = position % capacity
+        end = start + count
+        if end <= capacity:
+            return self._ring[start:end]
+        return np.concatenate((self._ring[start:], self._ring[: end - capacity]))
+
+    def _grow(self, needed: int):
+        """Reallocate the ring to hold at least needed samples, unwrapping the pending ones."""
+        capacity = len(self._ring)
+        while capacity < needed:
+            capacity *= 2
+        pending = self._write - self._read
+        ring = np.empty(capacity, dtype=np.float32)
+        ring[:pending] = self._take(self._read, pending)
+        self._ring = ring
+        self._read = 0
+        self._write = pending
 
     def add_audio(self, chunk: np.ndarray):
         """Add an audio chunk to the buffer."""
-        self._buffer.append(chunk)
-
+        count = len(chunk)
+        if self._write - self._read + count > len(self._ring):
+            self._grow(self._write - self._read + count)
+
+        capacity = len(self._ring)
+        start = self._write % capacity
+        first = min(count, capacity - start)
+        self._ring[start : start + first] = chunk[:first]
+        self._ring[: count - first] = chunk[first:]
+        self._write += count
+
+    @torch.inference_mode()
     def process(self) -> list[float]:
         """Process buffered audio and return speech probabilities for complete chunks."""
         probabilities = []
-        total_samples = sum(len(chunk) for chunk in self._buffer)
 
-        while total_samples >= self._chunk_size:
-            vad_audio = np.concatenate(self._buffer)
-            vad_chunk = vad_audio[: self._chunk_size]
-            remaining = vad_audio[self._chunk_size :]
-            self._buffer = [remaining] if len(remaining) > 0 else []
-            total_samples = len(remaining)
+        while self._write - self._read >= self._chunk_size:
+            vad_chunk = self._take(self._read, self._chunk_size)
+            self._read += self._chunk_size
 
-            audio_tensor = torch.from_numpy(vad_chunk.astype(np.float32))
+            # from_numpy wraps the ring's memory, so no copy is made per window
+            audio_tensor = torch.from_numpy(vad_chunk)
             speech_prob = self._vad_model(audio_tensor, self._sample_rate).item()
             probabilities.append(speech_prob)
 
         return probabilities
 
     def reset(self):
-        """Clear the audio buffer."""
-        self._buffer.clear()
+        """Clear the audio buffer and the model's recurrent state."""
+        self._read = self._write = 0
+        self._vad_model.reset_states()
 
 
 class WakeWordListener:
@@ -262,32 +516,29 @@ class WakeWordListener:
 
         # Rolling buffer: stores last N seconds of audio samples
         buffer_samples = int(self.sample_rate * buffer_duration)
-        self._ring_buffer = collections.deque(maxlen=buffer_samples)
+        self._ring_buffer = RollingAudioBuffer(buffer_samples)
 
         # Ensure openwakeword models are available
         if not ensure_openwakeword_models():
             raise RuntimeError("Failed to download required openwakeword models")
 
-        # Load wake word model
-        print(f"Loading wake word model from: {model_path}")
-        self._wake_model = Model(wakeword_models=[model_path], inference_framework="onnx")
-
-        # Load VAD model for end-of-speech detection
-        print("Loading VAD model...")
-        self._vad_model = load_silero_vad()
+        # Load wake word model, plus VAD model for end-of-speech detection
+        print(f"Loading wake word and VAD models from: {model_path}")
+        self._wake_model, self._vad_model = _load_models(model_path, self.chunk_size, self.sample_rate)
+        # Only one wake word model is loaded, so its score is the one prediction key
+        self._wake_key = next(iter(self._wake_model.models))
+        self._vad = VADProcessor(self._vad_model, self.sample_rate)
 
         # State (using Event for thread-safe interruption)
         self._interrupted = threading.Event()
         self._stream = None
 
-    def _create_audio_stream(self) -> sd.InputStream:
-        """Create and return an audio input stream with standard settings."""
-        return sd.InputStream(
-            samplerate=self.sample_rate,
-            channels=1,
-            dtype=np.int16,
-            blocksize=self.chunk_size,
-        )
+    @contextmanager
+    def _streaming(self) -> Iterator[sd.InputStream]:
+        """Run the shared input stream for one listening session."""
+        with _streaming(self.sample_rate, self.chunk_size) as stream:
+            self._stream = stream
+            yield stream
 
     def wait_for_wake_word_and_speech(self, on_wake_word: Callable[[], None] | None = None) -> np.ndarray | None:
         """
@@ -304,11 +555,10 @@ class WakeWordListener:
         self._interrupted.clear()
         self._ring_buffer.clear()
         self._wake_model.reset()
-
-        self._stream = self._create_audio_stream()
+        self._vad.reset()
 
         try:
-            with self._stream:
+            with self._streaming():
                 # Phase 1: Listen for wake word while filling buffer
                 if not self._wait_for_wake_word():
                     return None
@@ -343,16 +593,14 @@ class WakeWordListener:
         """
         while not self._interrupted.is_set():
             audio_chunk, _ = self._stream.read(self.chunk_size)
-            audio_chunk = audio_chunk.flatten()
+            audio_chunk = audio_chunk[:, 0]
 
             # Add to rolling buffer
             self._ring_buffer.extend(audio_chunk)
 
             # Check for wake word
-            predictions = self._wake_model.predict(audio_chunk)
-            for score in predictions.values():
-                if score >= self.threshold:
-                    return True
+            if self._wake_model.predict(audio_chunk)[self._wake_key] >= self.threshold:
+                return True
 
         return False
 
@@ -360,6 +608,9 @@ class WakeWordListener:
         """
         Continue recording after wake word until VAD detects silence.
 
+        Callers reset self._vad at the start of the session; listen_for_speech
+        hands over mid-utterance and keeps the VAD state it has built up.
+
         Args:
             include_buffer: If True, include rolling buffer contents in output.
 
@@ -367,31 +618,33 @@ class WakeWordListener:
             Complete audio: optionally rolling buffer contents + new audio.
         """
         # Start with buffered audio if requested
+        audio = AudioAccumulator()
         if include_buffer:
-            audio_chunks = [np.array(self._ring_buffer, dtype=np.int16)]
-        else:
-            audio_chunks = []
+            for part in self._ring_buffer.views():
+                audio.append(part)
 
-        last_speech_time = time.time()
         speech_detected = False
-        vad = VADProcessor(self._vad_model, self.sample_rate)
+        silent_windows = 0
+        max_silent_windows = _silence_windows(self.silence_duration, self.sample_rate)
+        vad = self._vad
 
         while not self._interrupted.is_set():
             audio_chunk, _ = self._stream.read(self.chunk_size)
-            audio_chunk = audio_chunk.flatten()
-            audio_chunks.append(audio_chunk)
+            audio_chunk = audio_chunk[:, 0]
+            audio.append(audio_chunk)
             vad.add_audio(audio_chunk)
 
             for speech_prob in vad.process():
                 if speech_prob > 0.5:
                     speech_detected = True
-                    last_speech_time = time.time()
+                    silent_windows = 0
+                elif speech_detected:
+                    silent_windows += 1
+                    # Stop once speech has been followed by enough silence
+                    if silent_windows > max_silent_windows:
+                        return audio.get()
 
-                # Stop if speech was detected and now silent
-                if speech_detected and (time.time() - last_speech_time) > self.silence_duration:
-                    return np.concatenate(audio_chunks)
-
-        return np.concatenate(audio_chunks) if audio_chunks else np.array([], dtype=np.int16)
+        return audio.get()
 
     def listen_for_speech(
         self, timeout: float = 5.0, play_tones: bool = True
@@ -415,21 +668,20 @@ class WakeWordListener:
         self._interrupted.clear()
         self._ring_buffer.clear()
 
-        vad = VADProcessor(self._vad_model, self.sample_rate)
-        start_time = time.time()
-
-        self._stream = self._create_audio_stream()
+        vad = self._vad
+        vad.reset()
+        start_time = time.monotonic()
 
         try:
-            with self._stream:
+            with self._streaming():
                 # Wait for speech to start (with timeout)
                 while not self._interrupted.is_set():
                     # Check timeout
-                    if (time.time() - start_time) > timeout:
+                    if (time.monotonic() - start_time) > timeout:
                         return None
 
                     audio_chunk, _ = self._stream.read(self.chunk_size)
-                    audio_chunk = audio_chunk.flatten()
+                    audio_chunk = audio_chunk[:, 0]
 
                     # Keep audio in ring buffer in case speech started
                     self._ring_buffer.extend(audio_chunk)
@@ -439,12 +691,7 @@ class WakeWordListener:
                         if speech_prob > 0.5:
                             # Trim ring buffer to only recent audio
                             # to avoid including long periods of silence from wait phase
-                            recent_samples = int(0.5 * self.sample_rate)  # 0.5 seconds
-                            buffer_array = np.array(self._ring_buffer, dtype=np.int16)
-                            self._ring_buffer.clear()
-                            self._ring_buffer.extend(
-                                buffer_array[-recent_samples:] if len(buffer_array) > recent_samples else buffer_array
-                            )
+                            self._ring_buffer.keep_last(int(0.5 * self.sample_rate))  # 0.5 seconds
                             audio = self._record_until_silence(include_buffer=True)
 
                             # Play descending tone to indicate done listening
@@ -462,11 +709,10 @@ class WakeWordListener:
     def stop(self):
         """Stop listening and clean up."""
         self._interrupted.set()
-        if self._stream is not None:
-            try:
-                self._stream.close()
-            except Exception:
-                pass
+        try:
+            _close_input_stream()
+        except Exception:
+            pass
 
     def is_interrupted(self) -> bool:
         """Check if the listener has been interrupted (thread-safe)."""